@@ -2,18 +2,88 @@
 Outline
 verify_employee_exists()
 get_employee()
+get_employees_bulk()
+get_employees_by_ids()
 get_employees_list()
+iter_employees()
+get_employee_by_email()
 """
 
-from typing import Optional
+import asyncio
+import time
+from functools import lru_cache
+from typing import AsyncIterator, Optional
+from urllib.parse import quote
 
 import httpx
+import orjson
+from cachetools import TTLCache
+from prometheus_client import Histogram
 
 from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# In-process cache TTL for list pages (in seconds). Single employee lookups
+# are cached by the validation service in app.core.employee_service, which
+# drops entries on employee events; caching them here as well would keep
+# serving the old record after that invalidation.
+EMPLOYEE_LIST_CACHE_TTL = 10
+
+# Attempts for connection errors (handled by the transport) and for 5xx
+# responses (handled by _request with exponential backoff).
+REQUEST_RETRIES = 3
+RETRY_BACKOFF_BASE = 0.05
+
+# Upper bound on in-flight requests issued by a single bulk lookup.
+BULK_FETCH_CONCURRENCY = 32
+
+# Connection pool sizing and connect timeout (in seconds). A connect that
+# takes longer than this is retried by the transport rather than waited on.
+MAX_CONNECTIONS = 200
+MAX_KEEPALIVE_CONNECTIONS = 100
+CONNECT_TIMEOUT = 0.5
+
+
+REQUEST_SECONDS = Histogram(
+    "http_client_request_seconds",
+    "Time spent on requests to the employee management service",
+    ["endpoint", "method", "status"],
+)
+
+
+def _endpoint_template(path: str) -> str:
+    """Collapse per-employee path segments so metric labels stay bounded."""
+    prefix, _, last = path.rpartition("/")
+    if prefix.endswith("/by-email"):
+        return f"{prefix}/{{email}}"
+    if last.isdigit():
+        return f"{prefix}/{{employee_id}}"
+    return path
+
+
+async def _on_request(request: httpx.Request) -> None:
+    request.extensions["t0"] = time.perf_counter()
+
+
+async def _on_response(response: httpx.Response) -> None:
+    request = response.request
+    started = request.extensions.get("t0")
+    if started is None:
+        return
+    REQUEST_SECONDS.labels(
+        endpoint=_endpoint_template(request.url.path),
+        method=request.method,
+        status=response.status_code,
+    ).observe(time.perf_counter() - started)
+
+
+@lru_cache(maxsize=256)
+def _list_params(offset: int, limit: int) -> httpx.QueryParams:
+    """Build (and memoize) the query parameters for a list page."""
+    return httpx.QueryParams({"offset": offset, "limit": limit})
+
 
 class EmployeeServiceClient:
     """
@@ -21,64 +91,237 @@ class EmployeeServiceClient:
     Provides methods to verify employee existence and retrieve employee details.
     """
 
-    def __init__(self, base_url: str, timeout: float = 30.0):
+    # Fixed endpoints are parsed once; httpx only has to join them onto
+    # base_url per request.
+    LIST_URL = httpx.URL("/api/v1/employees/internal/list")
+    BULK_URL = httpx.URL("/api/v1/employees/internal/bulk")
+
+    def __init__(
+        self,
+        base_url: httpx.URL | str,
+        timeout: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         """
         Initialize the employee service client.
 
         Args:
             base_url: Base URL of the employee management service
-            timeout: Request timeout in seconds
+            timeout: Read/write/pool timeout in seconds; connecting is bounded
+                separately by CONNECT_TIMEOUT
+            transport: Transport to send requests with (e.g. an
+                httpx.MockTransport in tests); defaults to a pooled HTTP/2 one
         """
-        self.base_url = base_url.rstrip("/")
+        self.base_url = str(base_url).rstrip("/")
+        self._base = httpx.URL(self.base_url)
         self.timeout = timeout
+        # One long-lived client so connections are kept alive and reused
+        # across calls instead of paying a new handshake per request.
+        # HTTP/2 lets concurrent lookups multiplex over a single connection,
+        # and the transport retries failed connection attempts itself.
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                retries=REQUEST_RETRIES,
+                limits=httpx.Limits(
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    max_connections=MAX_CONNECTIONS,
+                ),
+                http2=True,
+            )
+        self._client = httpx.AsyncClient(
+            base_url=self._base,
+            timeout=httpx.Timeout(timeout, connect=CONNECT_TIMEOUT),
+            transport=transport,
+            headers={"Accept": "application/json", "Accept-Encoding": "gzip"},
+            event_hooks={"request": [_on_request], "response": [_on_response]},
+        )
+        # Only touched from the event loop with no await between get and set,
+        # so it needs no lock.
+        self._list_cache: TTLCache = TTLCache(
+            maxsize=256, ttl=EMPLOYEE_LIST_CACHE_TTL
+        )
+        self._bulk_sem = asyncio.Semaphore(BULK_FETCH_CONCURRENCY)
+        # Whether the employee service exposes the bulk endpoint; None until
+        # the first call finds out.
+        self._bulk_endpoint_supported: Optional[bool] = None
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and release pooled connections."""
+        await self._client.aclose()
+
+    async def _request(
+        self, method: str, url: httpx.URL | str, stream: bool = False, **kwargs
+    ) -> httpx.Response:
+        """
+        Send a request, retrying 5xx responses with exponential backoff.
+
+        Connection-level failures are already retried by the transport and
+        still raise httpx.RequestError once those retries are exhausted.
+
+        With stream=True the body is not read; the caller must read it or
+        close the response.
+        """
+        request = self._client.build_request(method, url, **kwargs)
+        response = await self._client.send(request, stream=stream)
+        for attempt in range(REQUEST_RETRIES - 1):
+            if response.status_code < 500:
+                break
+            await response.aclose()
+            delay = 2**attempt * RETRY_BACKOFF_BASE
+            logger.warning(
+                "Employee service returned %s for %s, retrying in %.2fs",
+                response.status_code,
+                url,
+                delay,
+            )
+            await asyncio.sleep(delay)
+            response = await self._client.send(request, stream=stream)
+        return response
+
+    async def _fetch_employee(self, employee_id: int) -> tuple[int, Optional[dict]]:
+        """
+        Fetch a single employee record in one round trip.
+
+        Both the existence check and the detail lookup are served by the same
+        internal endpoint, so they share this request.
+
+        Args:
+            employee_id: Employee ID to fetch
+
+        Returns:
+            Tuple of (status_code, employee_data). employee_data is only set
+            for a 200 response; status_code is 0 if the request itself failed.
+        """
+        # Streamed so that a 404 is answered from the status line alone,
+        # without reading the error body.
+        try:
+            response = await self._request(
+                "GET", f"/api/v1/employees/internal/{employee_id}", stream=True
+            )
+            try:
+                if response.status_code != 200:
+                    return response.status_code, None
+                content = await response.aread()
+            finally:
+                await response.aclose()
+        except httpx.RequestError as e:
+            logger.error("Error fetching employee %s: %s", employee_id, e)
+            return 0, None
+
+        try:
+            employee_data = orjson.loads(content)
+        except ValueError as e:
+            logger.error("Invalid response for employee %s: %s", employee_id, e)
+            return 0, None
+        return response.status_code, employee_data
 
     async def verify_employee_exists(self, employee_id: int) -> bool:
         """
         Verify if an employee exists in the employee management service.
         Uses internal endpoint for service-to-service calls (no auth required).
         """
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/v1/employees/internal/{employee_id}"
-                )
-                exists = response.status_code == 200
-                logger.info(f"Employee {employee_id} existence check: {exists}")
-                return exists
-        except httpx.RequestError as e:
-            logger.error(f"Error verifying employee {employee_id}: {str(e)}")
-            return False
-        except Exception as e:
-            logger.error(f"Unexpected error verifying employee {employee_id}: {str(e)}")
-            return False
+        status_code, _ = await self._fetch_employee(employee_id)
+        exists = status_code == 200
+        logger.info("Employee %s existence check: %s", employee_id, exists)
+        return exists
 
     async def get_employee(self, employee_id: int) -> Optional[dict]:
         """
         Retrieve employee details from the employee management service.
         Uses internal endpoint for service-to-service calls (no auth required).
         """
+        status_code, employee_data = await self._fetch_employee(employee_id)
+        if employee_data is not None:
+            logger.info("Retrieved employee %s details", employee_id)
+            return employee_data
+        else:
+            logger.warning(
+                "Employee %s not found (status: %s)", employee_id, status_code
+            )
+            return None
+
+    async def get_employees_bulk(self, ids: list[int]) -> dict[int, Optional[dict]]:
+        """
+        Retrieve several employees concurrently.
+
+        Lookups run in parallel over the shared client, with at most
+        BULK_FETCH_CONCURRENCY requests in flight at once.
+
+        Args:
+            ids: Employee IDs to look up (duplicates are fetched once)
+
+        Returns:
+            Mapping of employee ID to employee data, or None if not found
+        """
+        missing = list(dict.fromkeys(ids))
+
+        async def fetch(employee_id: int) -> Optional[dict]:
+            async with self._bulk_sem:
+                _, employee_data = await self._fetch_employee(employee_id)
+                return employee_data
+
+        results = await asyncio.gather(*(fetch(i) for i in missing))
+        employees: dict[int, Optional[dict]] = dict(zip(missing, results))
+        found = sum(1 for r in results if r is not None)
+        logger.info("Retrieved %s of %s employees in bulk", found, len(missing))
+        return employees
+
+    async def get_employees_by_ids(self, ids: list[int]) -> dict[int, Optional[dict]]:
+        """
+        Retrieve several employees with a single request to the bulk endpoint.
+
+        If the employee service does not provide the bulk endpoint, this falls
+        back to get_employees_bulk() and remembers that for later calls.
+
+        Args:
+            ids: Employee IDs to look up (duplicates are fetched once)
+
+        Returns:
+            Mapping of employee ID to employee data, or None if not found
+        """
+        missing = list(dict.fromkeys(ids))
+        employees: dict[int, Optional[dict]] = dict.fromkeys(missing)
+        if not missing:
+            return employees
+
+        if self._bulk_endpoint_supported is False:
+            employees.update(await self.get_employees_bulk(missing))
+            return employees
+
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/v1/employees/internal/{employee_id}"
-                )
-                if response.status_code == 200:
-                    employee_data = response.json()
-                    logger.info(f"Retrieved employee {employee_id} details")
-                    return employee_data
-                else:
-                    logger.warning(
-                        f"Employee {employee_id} not found (status: {response.status_code})"
-                    )
-                    return None
+            response = await self._request(
+                "POST",
+                self.BULK_URL,
+                content=orjson.dumps({"ids": missing}),
+                headers={"Content-Type": "application/json"},
+            )
         except httpx.RequestError as e:
-            logger.error(f"Error retrieving employee {employee_id}: {str(e)}")
-            return None
-        except Exception as e:
-            logger.error(
-                f"Unexpected error retrieving employee {employee_id}: {str(e)}"
+            logger.error("Error retrieving employees in bulk: %s", e)
+            return employees
+
+        if response.status_code in (404, 405):
+            logger.info("Bulk employee endpoint unavailable, using per-ID lookups")
+            self._bulk_endpoint_supported = False
+            employees.update(await self.get_employees_bulk(missing))
+            return employees
+        if response.status_code != 200:
+            logger.warning(
+                "Failed to retrieve employees in bulk (status: %s)",
+                response.status_code,
             )
-            return None
+            return employees
+
+        self._bulk_endpoint_supported = True
+        try:
+            found = orjson.loads(response.content)
+        except ValueError as e:
+            logger.error("Invalid bulk employees response: %s", e)
+            return employees
+        for employee_data in found:
+            if employee_data.get("id") in employees:
+                employees[employee_data["id"]] = employee_data
+        logger.info("Retrieved %s employees in bulk", len(missing))
+        return employees
 
     async def get_employees_list(
         self, offset: int = 0, limit: int = 1000
@@ -94,28 +337,67 @@ class EmployeeServiceClient:
         Returns:
             List of employees if successful, None otherwise
         """
+        cached = self._list_cache.get((offset, limit))
+        if cached is not None:
+            return cached
+
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/v1/employees/internal/list",
-                    params={"offset": offset, "limit": limit},
+            response = await self._request(
+                "GET",
+                self.LIST_URL,
+                params=_list_params(offset, limit),
+            )
+            if response.status_code == 200:
+                employees = orjson.loads(response.content)
+                logger.info("Retrieved %s employees", len(employees))
+                self._list_cache[(offset, limit)] = employees
+                return employees
+            else:
+                logger.warning(
+                    "Failed to retrieve employees list (status: %s)",
+                    response.status_code,
                 )
-                if response.status_code == 200:
-                    employees = response.json()
-                    logger.info(f"Retrieved {len(employees)} employees")
-                    return employees
-                else:
-                    logger.warning(
-                        f"Failed to retrieve employees list (status: {response.status_code})"
-                    )
-                    return None
+                return None
         except httpx.RequestError as e:
-            logger.error(f"Error retrieving employees list: {str(e)}")
+            logger.error("Error retrieving employees list: %s", e)
             return None
-        except Exception as e:
-            logger.error(f"Unexpected error retrieving employees list: {str(e)}")
+        except ValueError as e:
+            logger.error("Invalid employees list response: %s", e)
             return None
 
+    async def iter_employees(self, page_size: int = 1000) -> AsyncIterator[list]:
+        """
+        Iterate over all employees page by page.
+
+        The next page is requested while the caller is still processing the
+        current one, so network latency overlaps with the caller's work.
+        Iteration stops at the first short page or failed request.
+
+        Args:
+            page_size: Number of employees per page
+
+        Yields:
+            Lists of employees, at most page_size long
+        """
+        offset = 0
+        next_task = asyncio.create_task(self.get_employees_list(offset, page_size))
+        try:
+            while True:
+                page = await next_task
+                if not page:
+                    return
+                if len(page) < page_size:
+                    yield page
+                    return
+                offset += page_size
+                next_task = asyncio.create_task(
+                    self.get_employees_list(offset, page_size)
+                )
+                yield page
+        finally:
+            if not next_task.done():
+                next_task.cancel()
+
     async def get_employee_by_email(self, email: str) -> Optional[dict]:
         """
         Retrieve employee details by email address.
@@ -127,37 +409,48 @@ class EmployeeServiceClient:
         Returns:
             Employee data if found, None otherwise
         """
+        # Encode once so characters like "+" or "/" survive as a single path segment
+        safe_email = quote(email, safe="@")
+
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/v1/employees/internal/by-email/{email}"
+            response = await self._request(
+                "GET", f"/api/v1/employees/internal/by-email/{safe_email}"
+            )
+            if response.status_code == 200:
+                employee_data = orjson.loads(response.content)
+                logger.info(
+                    "Found employee with email %s: %s", email, employee_data.get("id")
+                )
+                return employee_data
+            elif response.status_code == 404:
+                logger.warning("No employee found with email %s", email)
+                return None
+            else:
+                logger.warning(
+                    "Failed to retrieve employee by email (status: %s)",
+                    response.status_code,
                 )
-                if response.status_code == 200:
-                    employee_data = response.json()
-                    logger.info(
-                        f"Found employee with email {email}: {employee_data.get('id')}"
-                    )
-                    return employee_data
-                elif response.status_code == 404:
-                    logger.warning(f"No employee found with email {email}")
-                    return None
-                else:
-                    logger.warning(
-                        f"Failed to retrieve employee by email (status: {response.status_code})"
-                    )
-                    return None
+                return None
         except httpx.RequestError as e:
-            logger.error(f"Error retrieving employee by email {email}: {str(e)}")
+            logger.error("Error retrieving employee by email %s: %s", email, e)
             return None
-        except Exception as e:
-            logger.error(
-                f"Unexpected error retrieving employee by email {email}: {str(e)}"
-            )
+        except ValueError as e:
+            logger.error("Invalid response for employee email %s: %s", email, e)
             return None
 
 
-# Create a singleton instance
-# URL should be set via environment variable: EMPLOYEE_SERVICE_URL
-employee_service = EmployeeServiceClient(
-    base_url=getattr(settings, "EMPLOYEE_SERVICE_URL", "http://localhost:8001")
-)
+@lru_cache
+def get_employee_service() -> EmployeeServiceClient:
+    """
+    Return the shared employee service client, creating it on first use.
+
+    Built lazily so the pooled HTTP client is created inside the running
+    event loop rather than at import time.
+
+    URL should be set via environment variable: EMPLOYEE_SERVICE_URL
+    Timeout should be set via environment variable: EMPLOYEE_SERVICE_TIMEOUT
+    """
+    return EmployeeServiceClient(
+        base_url=str(settings.EMPLOYEE_SERVICE_URL),
+        timeout=settings.EMPLOYEE_SERVICE_TIMEOUT,
+    )
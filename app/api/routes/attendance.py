@@ -1,10 +1,26 @@
-from datetime import datetime, timedelta
-from typing import Annotated
-
-from fastapi import APIRouter, Depends, HTTPException, Query
+import asyncio
+import calendar
+from datetime import date, datetime
+from typing import Annotated, AsyncIterator, Optional
+
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Path, Query
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import Row, func, literal_column, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncResult
 from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.dependencies import CurrentUserDep, SessionDep
+from app.core.cache import (
+    CACHE_TTL_DAY,
+    CACHE_TTL_SHORT,
+    cache_monthly_summary,
+    get_cached_monthly_summary,
+    invalidate_monthly_summary,
+)
 from app.core.employee_service import employee_validation_service
 from app.core.events import (
     AttendanceCheckinEvent,
@@ -36,12 +52,248 @@ router = APIRouter(
     responses={404: {"description": "Attendance record not found"}},
 )
 
+# Groups allowed to act on any employee's attendance. The sets differ per
+# endpoint (both spellings are in use); keep them as they are, since any
+# change to them is an access-control change of its own.
+
+# Check in any employee
+CHECK_IN_ROLES = frozenset(
+    {
+        "HR-Administrators",
+        "HR_Administrators",
+        "HR-Managers",
+        "HR_Managers",
+        "Managers",
+        "manager",
+    }
+)
+
+# Check out any employee, view anyone's history and summary, open the dashboard
+HR_MANAGER_ROLES = frozenset(
+    {
+        "HR-Administrators",
+        "HR_Administrators",
+        "HR-Managers",
+        "HR_Managers",
+        "Team-Managers",
+        "Manager",
+        "manager",
+    }
+)
+
+# View a single attendance record by ID
+RECORD_VIEW_ROLES = frozenset(
+    {
+        "HR-Administrators",
+        "HR_Administrators",
+        "HR-Managers",
+        "Team-Managers",
+        "manager",
+    }
+)
+
+
+def _in_any_group(roles: frozenset[str]):
+    """Build a dependency telling whether the current user is in any of roles."""
+
+    async def dependency(current_user: CurrentUserDep) -> bool:
+        return not roles.isdisjoint(current_user.groups)
+
+    return dependency
+
+
+CanCheckInAnyoneDep = Annotated[bool, Depends(_in_any_group(CHECK_IN_ROLES))]
+IsHrOrManagerDep = Annotated[bool, Depends(_in_any_group(HR_MANAGER_ROLES))]
+
+# Rows fetched per round trip when streaming the dashboard records
+DASHBOARD_YIELD_PER = 200
+
+# Columns behind AttendancePublic; list queries select only these instead of
+# hydrating full Attendance objects
+PUBLIC_COLUMNS = tuple(
+    getattr(Attendance, name) for name in AttendancePublic.model_fields
+)
+
+# Validates and serializes a whole chunk of PUBLIC_COLUMNS rows in one call
+PUBLIC_LIST_ADAPTER = TypeAdapter(list[AttendancePublic])
+
+
+async def _upsert_check_in(
+    session: AsyncSession, employee_id: int, today: str, check_in_time: datetime
+) -> Attendance:
+    """
+    Insert today's attendance record or stamp the check-in on the existing one.
+
+    Runs as a single INSERT ... ON DUPLICATE KEY UPDATE against the unique
+    (employee_id, date) index, so concurrent check-ins cannot create two
+    records for the same day.
+
+    Args:
+        session: Database session
+        employee_id: Employee checking in
+        today: Attendance date in YYYY-MM-DD format
+        check_in_time: Check-in timestamp
+
+    Returns:
+        The attendance record after the check-in
+    """
+    statement = mysql_insert(Attendance).values(
+        employee_id=employee_id,
+        date=today,
+        check_in_time=check_in_time,
+        status="present",
+    )
+    statement = statement.on_duplicate_key_update(
+        check_in_time=statement.inserted.check_in_time,
+        status=statement.inserted.status,
+        # Column onupdate does not apply to ON DUPLICATE KEY UPDATE, so reuse
+        # the insert's client-side UTC default
+        updated_at=statement.inserted.updated_at,
+    )
+    await session.exec(statement)
+    await session.commit()
+    invalidate_monthly_summary(employee_id, today[:7])
+
+    # MySQL has no RETURNING, so read the row back; the unique index checked at
+    # startup keeps this to one row, the ordering only guards older data
+    statement = (
+        select(Attendance)
+        .where((Attendance.employee_id == employee_id) & (Attendance.date == today))
+        .order_by(Attendance.id)
+    )
+    return (await session.exec(statement)).first()
+
+
+async def _record_check_out(
+    session: AsyncSession, employee_id: int, today: str, check_out_time: datetime
+) -> Optional[Attendance]:
+    """
+    Stamp the check-out time on today's attendance record.
+
+    Updates the row directly instead of loading it first.
+
+    Args:
+        session: Database session
+        employee_id: Employee checking out
+        today: Attendance date in YYYY-MM-DD format
+        check_out_time: Check-out timestamp
+
+    Returns:
+        The updated attendance record, or None if there is no record for today
+    """
+    today_filter = (Attendance.employee_id == employee_id) & (Attendance.date == today)
+    result = await session.exec(
+        update(Attendance)
+        .where(today_filter)
+        .values(check_out_time=check_out_time)
+    )
+    if result.rowcount == 0:
+        return None
+    await session.commit()
+    invalidate_monthly_summary(employee_id, today[:7])
+
+    # MySQL has no RETURNING, so read the row back
+    statement = select(Attendance).where(today_filter).order_by(Attendance.id)
+    return (await session.exec(statement)).first()
+
+
+def _check_in_event(record: Attendance, actor_user_id: str) -> EventEnvelope:
+    """
+    Build the check-in event for an attendance record.
+
+    Timestamps stay as datetime objects; publish_event serializes them.
+
+    Args:
+        record: Attendance record after the check-in
+        actor_user_id: Subject of the user who performed the check-in
+
+    Returns:
+        Event envelope ready to publish
+    """
+    return EventEnvelope(
+        event_type=EventType.ATTENDANCE_CHECKIN,
+        data={
+            "attendance_id": str(record.id),
+            "employee_id": record.employee_id,
+            "check_in_time": record.check_in_time,
+            "check_out_time": record.check_out_time,
+            "status": record.status,
+            "date": record.date,
+        },
+        metadata=EventMetadata(actor_user_id=actor_user_id),
+    )
+
+
+def _check_out_event(record: Attendance, actor_user_id: str) -> EventEnvelope:
+    """
+    Build the attendance updated event for a check-out.
+
+    Args:
+        record: Attendance record after the check-out
+        actor_user_id: Subject of the user who performed the check-out
+
+    Returns:
+        Event envelope ready to publish
+    """
+    return EventEnvelope(
+        event_type=EventType.ATTENDANCE_UPDATED,
+        data={
+            "attendance_id": str(record.id),
+            "employee_id": record.employee_id,
+            "updated_fields": {"check_out_time": record.check_out_time},
+        },
+        metadata=EventMetadata(actor_user_id=actor_user_id),
+    )
+
+
+async def _stream_dashboard(
+    result: AsyncResult, first: list[Row], summary: dict
+) -> AsyncIterator[bytes]:
+    """
+    Stream the dashboard JSON object, fetching its records in chunks.
+
+    Only one chunk of DASHBOARD_YIELD_PER rows is held in memory at a time,
+    however many employees checked in. The caller fetches the first chunk
+    before the response starts, so a failing query still gets an error
+    status; a database error on a later chunk can only cut the body short,
+    leaving JSON that fails to parse rather than a truncated record list.
+
+    Args:
+        result: Streamed query result over the PUBLIC_COLUMNS of the records
+        first: First chunk of rows, already fetched from result
+        summary: Dashboard statistics written ahead of the records
+
+    Yields:
+        Pieces of the JSON response body
+    """
+    try:
+        # Open the object with the statistics, then the records array
+        yield orjson.dumps(summary)[:-1] + b',"records":['
+        partition = first
+        separator = b""
+        while partition:
+            records = PUBLIC_LIST_ADAPTER.validate_python(
+                partition, from_attributes=True
+            )
+            # Drop the array brackets so chunks join into the one records array
+            yield separator + PUBLIC_LIST_ADAPTER.dump_json(records)[1:-1]
+            separator = b","
+            partition = await result.fetchmany(DASHBOARD_YIELD_PER)
+        yield b"]}"
+    except Exception as e:
+        logger.error(f"Dashboard stream failed after the response started: {e}")
+        raise
+    finally:
+        await result.close()
+
 
 @router.post("/check-in", response_model=AttendancePublic, status_code=201)
 async def check_in(
     request: CheckInRequest,
     session: SessionDep,
     current_user: CurrentUserDep,
+    is_hr_or_manager: CanCheckInAnyoneDep,
+    background_tasks: BackgroundTasks,
 ) -> Attendance:
     """
     Employee check-in endpoint.
@@ -53,6 +305,8 @@ async def check_in(
         request: Check-in request with employee_id
         session: Database session (injected)
         current_user: Current authenticated user
+        is_hr_or_manager: Whether the user is in an HR/manager group (injected)
+        background_tasks: Background tasks (injected, used to publish events)
 
     Returns:
         Created or updated attendance record with check-in time
@@ -60,50 +314,15 @@ async def check_in(
     Raises:
         HTTPException: 400 if employee doesn't exist, 403 if unauthorized, 404 if not found
     """
-    # RBAC: Employees can only check in themselves
-    # HR-Administrators, HR-Managers, and Team-Managers can check in anyone
-    is_hr_or_manager = any(
-        role in current_user.groups
-        for role in [
-            "HR-Administrators",
-            "HR_Administrators",
-            "HR-Managers",
-            "HR_Managers",
-            "Managers",
-            "manager",
-        ]
-    )
-
-    if not is_hr_or_manager:
-        # Regular employees can only check in themselves
-        # Verify the employee_id matches the current user's employee record
-        employee_data = await employee_validation_service.get_employee(
-            request.employee_id
-        )
-        if not employee_data:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Employee {request.employee_id} does not exist",
-            )
-
-        # Check if the employee's email matches the current user's email
-        if employee_data.get("email") != current_user.email:
-            logger.warning(
-                f"User {current_user.email} attempted to check in for another employee {request.employee_id}"
-            )
-            raise HTTPException(
-                status_code=403,
-                detail="You can only check in for yourself",
-            )
-
     logger.info(
         f"Check-in initiated by {current_user.email} for employee {request.employee_id}"
     )
-    # Verify employee exists using cache-first approach
-    employee_exists = await employee_validation_service.verify_employee_exists_async(
-        request.employee_id
+    # One lookup serves both the existence check and RBAC; fresh, so a status
+    # change handled by another replica is not missed
+    employee_data = await employee_validation_service.get_employee(
+        request.employee_id, session=session, fresh=True
     )
-    if not employee_exists:
+    if not employee_data or not employee_validation_service.is_active(employee_data):
         logger.warning(
             f"Check-in attempted for non-existent employee {request.employee_id}"
         )
@@ -112,91 +331,32 @@ async def check_in(
             detail=f"Employee {request.employee_id} does not exist",
         )
 
-    # Get today's date in YYYY-MM-DD format
-    today = datetime.now().date().isoformat()
-    check_in_time = datetime.now()
-
-    # Check if attendance record already exists for today
-    statement = select(Attendance).where(
-        (Attendance.employee_id == request.employee_id) & (Attendance.date == today)
-    )
-    existing_record = session.exec(statement).first()
-
-    if existing_record:
-        # Update existing record with check-in time
-        logger.info(f"Updating check-in for employee {request.employee_id} on {today}")
-        existing_record.check_in_time = check_in_time
-        existing_record.status = "present"
-        existing_record.updated_at = datetime.now()
-        session.add(existing_record)
-        session.commit()
-        session.refresh(existing_record)
-        logger.info(f"Employee {request.employee_id} checked in at {check_in_time}")
-
-        # Publish attendance marked event
-        try:
-            event = EventEnvelope(
-                event_type=EventType.ATTENDANCE_MARKED,
-                data={
-                    "attendance_id": str(existing_record.id),
-                    "employee_id": existing_record.employee_id,
-                    "check_in_time": existing_record.check_in_time.isoformat()
-                    if existing_record.check_in_time
-                    else None,
-                    "check_out_time": existing_record.check_out_time.isoformat()
-                    if existing_record.check_out_time
-                    else None,
-                    "status": existing_record.status,
-                    "date": existing_record.date,
-                },
-                metadata=EventMetadata(user_id=current_user.sub),
-            )
-            await publish_event("attendance-events", event)
-            logger.info(f"Published attendance marked event for: {existing_record.id}")
-        except Exception as e:
-            logger.warning(f"Failed to publish attendance marked event: {e}")
-
-        return existing_record
-    else:
-        # Create new attendance record
-        logger.info(
-            f"Creating new check-in for employee {request.employee_id} on {today}"
+    # RBAC: Employees can only check in themselves, HR/Managers can check in anyone
+    if not is_hr_or_manager and employee_data.get("email") != current_user.email:
+        logger.warning(
+            f"User {current_user.email} attempted to check in for another employee {request.employee_id}"
         )
-        new_record = Attendance(
-            employee_id=request.employee_id,
-            date=today,
-            check_in_time=check_in_time,
-            status="present",
+        raise HTTPException(
+            status_code=403,
+            detail="You can only check in for yourself",
         )
-        session.add(new_record)
-        session.commit()
-        session.refresh(new_record)
-        logger.info(f"Employee {request.employee_id} checked in at {check_in_time}")
-
-        # Publish attendance marked event
-        try:
-            event = EventEnvelope(
-                event_type=EventType.ATTENDANCE_MARKED,
-                data={
-                    "attendance_id": str(new_record.id),
-                    "employee_id": new_record.employee_id,
-                    "check_in_time": new_record.check_in_time.isoformat()
-                    if new_record.check_in_time
-                    else None,
-                    "check_out_time": new_record.check_out_time.isoformat()
-                    if new_record.check_out_time
-                    else None,
-                    "status": new_record.status,
-                    "date": new_record.date,
-                },
-                metadata=EventMetadata(user_id=current_user.sub),
-            )
-            await publish_event("attendance-events", event)
-            logger.info(f"Published attendance marked event for: {new_record.id}")
-        except Exception as e:
-            logger.warning(f"Failed to publish attendance marked event: {e}")
 
-        return new_record
+    # Get today's date in YYYY-MM-DD format
+    now = datetime.now()
+    today = now.date().isoformat()
+    check_in_time = now
+
+    # Create today's record, or stamp the check-in on the existing one
+    logger.info(f"Recording check-in for employee {request.employee_id} on {today}")
+    record = await _upsert_check_in(session, request.employee_id, today, check_in_time)
+    logger.info(f"Employee {request.employee_id} checked in at {check_in_time}")
+
+    # Publish attendance check-in event
+    event = _check_in_event(record, current_user.sub)
+    background_tasks.add_task(publish_event, "attendance-events", event)
+    logger.info(f"Queued attendance check-in event for: {record.id}")
+
+    return record
 
 
 @router.post("/check-out", response_model=AttendancePublic, status_code=200)
@@ -204,6 +364,8 @@ async def check_out(
     request: CheckOutRequest,
     session: SessionDep,
     current_user: CurrentUserDep,
+    is_hr_or_manager: IsHrOrManagerDep,
+    background_tasks: BackgroundTasks,
 ) -> Attendance:
     """
     Employee check-out endpoint.
@@ -215,6 +377,8 @@ async def check_out(
         request: Check-out request with employee_id
         session: Database session (injected)
         current_user: Current authenticated user
+        is_hr_or_manager: Whether the user is in an HR/manager group (injected)
+        background_tasks: Background tasks (injected, used to publish events)
 
     Returns:
         Updated attendance record with check-out time
@@ -222,48 +386,15 @@ async def check_out(
     Raises:
         HTTPException: 400 if employee doesn't exist, 403 if unauthorized, 404 if no check-in found
     """
-    # RBAC: Employees can only check out themselves
-    is_hr_or_manager = any(
-        role in current_user.groups
-        for role in [
-            "HR-Administrators",
-            "HR-Managers",
-            "Team-Managers",
-            "HR_Administrators",
-            "HR_Managers",
-            "Manager",
-            "manager",
-        ]
-    )
-
-    if not is_hr_or_manager:
-        # Regular employees can only check out themselves
-        employee_data = await employee_validation_service.get_employee(
-            request.employee_id
-        )
-        if not employee_data:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Employee {request.employee_id} does not exist",
-            )
-
-        if employee_data.get("email") != current_user.email:
-            logger.warning(
-                f"User {current_user.email} attempted to check out another employee {request.employee_id}"
-            )
-            raise HTTPException(
-                status_code=403,
-                detail="You can only check out for yourself",
-            )
-
     logger.info(
         f"Check-out initiated by {current_user.email} for employee {request.employee_id}"
     )
-    # Verify employee exists using cache-first approach
-    employee_exists = await employee_validation_service.verify_employee_exists_async(
-        request.employee_id
+    # One lookup serves both the existence check and RBAC; fresh, so a status
+    # change handled by another replica is not missed
+    employee_data = await employee_validation_service.get_employee(
+        request.employee_id, session=session, fresh=True
     )
-    if not employee_exists:
+    if not employee_data or not employee_validation_service.is_active(employee_data):
         logger.warning(
             f"Check-out attempted for non-existent employee {request.employee_id}"
         )
@@ -272,15 +403,24 @@ async def check_out(
             detail=f"Employee {request.employee_id} does not exist",
         )
 
+    # RBAC: Employees can only check out themselves, HR/Managers can check out anyone
+    if not is_hr_or_manager and employee_data.get("email") != current_user.email:
+        logger.warning(
+            f"User {current_user.email} attempted to check out another employee {request.employee_id}"
+        )
+        raise HTTPException(
+            status_code=403,
+            detail="You can only check out for yourself",
+        )
+
     # Get today's date in YYYY-MM-DD format
-    today = datetime.now().date().isoformat()
-    check_out_time = datetime.now()
+    now = datetime.now()
+    today = now.date().isoformat()
+    check_out_time = now
 
-    # Find today's attendance record
-    statement = select(Attendance).where(
-        (Attendance.employee_id == request.employee_id) & (Attendance.date == today)
-    )
-    record = session.exec(statement).first()
+    # Stamp the check-out on today's record
+    logger.info(f"Updating check-out for employee {request.employee_id} on {today}")
+    record = await _record_check_out(session, request.employee_id, today, check_out_time)
 
     if not record:
         logger.warning(
@@ -290,51 +430,23 @@ async def check_out(
             status_code=404,
             detail="No check-in record found for today. Please check in first.",
         )
-
-    # Update record with check-out time
-    logger.info(f"Updating check-out for employee {request.employee_id} on {today}")
-    record.check_out_time = check_out_time
-    record.updated_at = datetime.now()
-    session.add(record)
-    session.commit()
-    session.refresh(record)
     logger.info(f"Employee {request.employee_id} checked out at {check_out_time}")
 
     # Publish attendance updated event
-    try:
-        event = EventEnvelope(
-            event_type=EventType.ATTENDANCE_UPDATED,
-            data={
-                "attendance_id": str(record.id),
-                "employee_id": record.employee_id,
-                "updated_fields": {"check_out_time": check_out_time.isoformat()},
-            },
-            metadata=EventMetadata(user_id=current_user.sub),
-        )
-        await publish_event("attendance-events", event)
-        logger.info(f"Published attendance updated event for: {record.id}")
-    except Exception as e:
-        logger.warning(f"Failed to publish attendance updated event: {e}")
+    event = _check_out_event(record, current_user.sub)
+    background_tasks.add_task(publish_event, "attendance-events", event)
+    logger.info(f"Queued attendance updated event for: {record.id}")
 
     return record
 
 
 @router.get("/{attendance_id}", response_model=AttendancePublic)
-def get_attendance(
+async def get_attendance(
     attendance_id: int,
     session: SessionDep,
     current_user: Annotated[
         TokenData,
-        Depends(
-            require_role(
-                "HR-Administrators",
-                "HR-Managers",
-                "Team-Managers",
-                "HR_Administrators",
-                "HR_ManagersManager",
-                "manager",
-            )
-        ),
+        Depends(require_role(*sorted(RECORD_VIEW_ROLES))),
     ],
 ) -> Attendance:
     """
@@ -354,7 +466,7 @@ def get_attendance(
         HTTPException: 403 if unauthorized, 404 if attendance record not found
     """
     logger.info(f"Fetching attendance record with ID: {attendance_id}")
-    record = session.get(Attendance, attendance_id)
+    record = await session.get(Attendance, attendance_id)
     if not record:
         logger.warning(f"Attendance record with ID {attendance_id} not found")
         raise HTTPException(status_code=404, detail="Attendance record not found")
@@ -367,10 +479,11 @@ async def get_employee_attendance(
     employee_id: int,
     session: SessionDep,
     current_user: CurrentUserDep,
+    is_hr_or_manager: IsHrOrManagerDep,
     offset: int = 0,
     limit: Annotated[int, Query(le=100)] = 100,
-    start_date: str | None = None,
-    end_date: str | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
 ) -> list[Attendance]:
     """
     Get all attendance records for a specific employee.
@@ -382,6 +495,7 @@ async def get_employee_attendance(
         employee_id: The ID of the employee
         session: Database session (injected)
         current_user: Current authenticated user
+        is_hr_or_manager: Whether the user is in an HR/manager group (injected)
         offset: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100, max: 100)
         start_date: Optional start date in YYYY-MM-DD format
@@ -391,25 +505,13 @@ async def get_employee_attendance(
         List of attendance records for the employee
 
     Raises:
-        HTTPException: 400 if date format is invalid, 403 if unauthorized
+        HTTPException: 403 if unauthorized (422 if a date is not YYYY-MM-DD)
     """
-    # RBAC: Employees can only view their own records
-    is_hr_or_manager = any(
-        role in current_user.groups
-        for role in [
-            "HR-Administrators",
-            "HR-Managers",
-            "Team-Managers",
-            "HR_Administrators",
-            "HR_Managers",
-            "Manager",
-            "manager",
-        ]
-    )
-
     if not is_hr_or_manager:
         # Regular employees can only view their own attendance
-        employee_data = await employee_validation_service.get_employee(employee_id)
+        employee_data = await employee_validation_service.get_employee(
+            employee_id, session=session
+        )
         if not employee_data:
             raise HTTPException(
                 status_code=404,
@@ -431,41 +533,28 @@ async def get_employee_attendance(
 
     statement = select(Attendance).where(Attendance.employee_id == employee_id)
 
-    # Apply date range filters if provided
+    # Apply date range filters if provided; dates are stored as YYYY-MM-DD strings
     if start_date:
-        try:
-            datetime.fromisoformat(start_date)
-            statement = statement.where(Attendance.date >= start_date)
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail="start_date must be in YYYY-MM-DD format",
-            )
-
+        statement = statement.where(Attendance.date >= start_date.isoformat())
     if end_date:
-        try:
-            datetime.fromisoformat(end_date)
-            statement = statement.where(Attendance.date <= end_date)
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail="end_date must be in YYYY-MM-DD format",
-            )
+        statement = statement.where(Attendance.date <= end_date.isoformat())
 
     statement = statement.offset(offset).limit(limit)
-    records = session.exec(statement).all()
+    records = (await session.exec(statement)).all()
     logger.info(
         f"Retrieved {len(records)} attendance record(s) for employee {employee_id}"
     )
-    return list(records)
+    return records
 
 
 @router.get("/summary/{employee_id}/{month}", response_model=MonthlySummary)
 async def get_monthly_summary(
     employee_id: int,
-    month: str,
+    month: Annotated[str, Path(pattern=r"^\d{4}-(0[1-9]|1[0-2])$")],
     session: SessionDep,
     current_user: CurrentUserDep,
+    is_hr_or_manager: IsHrOrManagerDep,
+    include_records: bool = True,
 ) -> MonthlySummary:
     """
     Get monthly attendance summary for a specific employee.
@@ -478,30 +567,20 @@ async def get_monthly_summary(
         month: Month in YYYY-MM format
         session: Database session (injected)
         current_user: Current authenticated user
+        is_hr_or_manager: Whether the user is in an HR/manager group (injected)
+        include_records: Whether to include the month's attendance records
 
     Returns:
         Monthly attendance summary with statistics and records
 
     Raises:
-        HTTPException: 400 if month format is invalid, 403 if unauthorized
+        HTTPException: 403 if unauthorized (422 if month is not YYYY-MM)
     """
-    # RBAC: Employees can only view their own summary
-    is_hr_or_manager = any(
-        role in current_user.groups
-        for role in [
-            "HR-Administrators",
-            "HR-Managers",
-            "Team-Managers",
-            "HR_Administrators",
-            "HR_Managers",
-            "Manager",
-            "manager",
-        ]
-    )
-
     if not is_hr_or_manager:
         # Regular employees can only view their own summary
-        employee_data = await employee_validation_service.get_employee(employee_id)
+        employee_data = await employee_validation_service.get_employee(
+            employee_id, session=session
+        )
         if not employee_data:
             raise HTTPException(
                 status_code=404,
@@ -518,67 +597,109 @@ async def get_monthly_summary(
             )
     logger.info(f"Fetching monthly summary for employee {employee_id}, month {month}")
 
-    # Validate month format
-    try:
-        datetime.fromisoformat(f"{month}-01")
-    except ValueError:
-        raise HTTPException(
-            status_code=400,
-            detail="Month must be in YYYY-MM format",
-        )
+    # Summaries are invalidated whenever a check-in/check-out touches the month
+    cached = get_cached_monthly_summary(employee_id, month, include_records)
+    if cached:
+        logger.info(f"Monthly summary for employee {employee_id} served from cache")
+        return MonthlySummary.model_validate(cached)
+
+    # The path pattern has already validated the YYYY-MM format
+    first_of_month = date(int(month[:4]), int(month[5:]), 1)
 
     # Get all records for the month
-    start_date = f"{month}-01"
+    start_date = first_of_month.isoformat()
     # Calculate last day of month
-    first_of_month = datetime.fromisoformat(f"{month}-01")
-    if first_of_month.month == 12:
-        last_of_month = datetime(first_of_month.year + 1, 1, 1) - timedelta(days=1)
-    else:
-        last_of_month = datetime(
-            first_of_month.year, first_of_month.month + 1, 1
-        ) - timedelta(days=1)
-    end_date = last_of_month.date().isoformat()
-
-    statement = select(Attendance).where(
+    _, days_in_month = calendar.monthrange(first_of_month.year, first_of_month.month)
+    end_date = first_of_month.replace(day=days_in_month).isoformat()
+    in_month = (
         (Attendance.employee_id == employee_id)
         & (Attendance.date >= start_date)
         & (Attendance.date <= end_date)
     )
-    records = session.exec(statement).all()
 
-    # Calculate statistics
-    present_count = sum(1 for r in records if r.status == "present")
-    absent_count = sum(1 for r in records if r.status == "absent")
-    late_count = sum(1 for r in records if r.status == "late")
+    # Aggregate per status in the database instead of loading every row
+    worked_seconds = func.timestampdiff(
+        literal_column("SECOND"), Attendance.check_in_time, Attendance.check_out_time
+    )
+    statement = (
+        select(
+            Attendance.status,
+            func.count().label("days"),
+            func.count(worked_seconds).label("days_worked"),
+            func.coalesce(func.sum(worked_seconds), 0).label("seconds"),
+            func.coalesce(func.sum(Attendance.overtime_hours), 0).label("overtime"),
+            func.coalesce(func.sum(Attendance.short_leave_hours), 0).label(
+                "short_leave"
+            ),
+        )
+        .where(in_month)
+        .group_by(Attendance.status)
+    )
+    by_status = {row.status: row for row in (await session.exec(statement)).all()}
+
+    def days_with(status: str) -> int:
+        row = by_status.get(status)
+        return row.days if row else 0
+
+    present_count = days_with("present")
+    absent_count = days_with("absent")
+    late_count = days_with("late")
+    on_leave_count = days_with("on_leave")
+
+    total_hours = sum(float(r.seconds) for r in by_status.values()) / 3600
+    days_worked = sum(r.days_worked for r in by_status.values())
+    overtime_hours = sum(float(r.overtime) for r in by_status.values())
+    short_leave_hours = sum(float(r.short_leave) for r in by_status.values())
+
+    # Working days are the weekdays of the month
+    working_days = sum(
+        1
+        for week in calendar.monthcalendar(first_of_month.year, first_of_month.month)
+        for day in week[:5]
+        if day
+    )
 
-    # Calculate total working hours
-    total_hours = 0.0
-    for record in records:
-        if record.check_in_time and record.check_out_time:
-            duration = record.check_out_time - record.check_in_time
-            total_hours += duration.total_seconds() / 3600
+    records = []
+    if include_records:
+        records = (await session.exec(select(*PUBLIC_COLUMNS).where(in_month))).all()
 
     logger.info(
         f"Monthly summary for employee {employee_id}: "
         f"{present_count} present, {absent_count} absent, {late_count} late"
     )
 
-    return MonthlySummary(
+    summary = MonthlySummary(
         employee_id=employee_id,
         month=month,
-        total_days_worked=present_count,
-        total_present=present_count,
-        total_absent=absent_count,
-        total_late=late_count,
-        working_hours=total_hours,
-        records=[AttendancePublic.model_validate(r) for r in records],
+        year=first_of_month.year,
+        total_working_days=working_days,
+        days_present=present_count,
+        days_absent=absent_count,
+        days_late=late_count,
+        days_on_leave=on_leave_count,
+        total_hours_worked=round(total_hours, 2),
+        average_daily_hours=round(total_hours / days_worked, 2) if days_worked else 0.0,
+        total_overtime_hours=round(overtime_hours, 2),
+        total_short_leave_hours=round(short_leave_hours, 2),
+        attendance_rate=round((present_count + late_count) / working_days * 100, 2)
+        if working_days
+        else 0.0,
+        records=PUBLIC_LIST_ADAPTER.validate_python(records, from_attributes=True),
     )
 
+    # Past months rarely change, so they can stay cached much longer
+    ttl = CACHE_TTL_DAY if month < datetime.now().strftime("%Y-%m") else CACHE_TTL_SHORT
+    cache_monthly_summary(
+        employee_id, month, include_records, summary.model_dump(mode="json"), ttl
+    )
+    return summary
+
 
 @router.post("/check-in/me", response_model=AttendancePublic, status_code=201)
 async def check_in_self(
     session: SessionDep,
     current_user: CurrentUserDep,
+    background_tasks: BackgroundTasks,
 ) -> Attendance:
     """
     Employee self check-in endpoint (simplified - no employee_id required).
@@ -589,6 +710,7 @@ async def check_in_self(
     Args:
         session: Database session (injected)
         current_user: Current authenticated user
+        background_tasks: Background tasks (injected, used to publish events)
 
     Returns:
         Created or updated attendance record with check-in time
@@ -598,9 +720,9 @@ async def check_in_self(
     """
     logger.info(f"Self check-in initiated by {current_user.email}")
 
-    # Look up employee by current user's email
+    # Look up employee by current user's email; fresh, as it gates the write
     employee_data = await employee_validation_service.get_employee_by_email(
-        current_user.email
+        current_user.email, session=session, fresh=True
     )
     if not employee_data:
         raise HTTPException(
@@ -611,94 +733,28 @@ async def check_in_self(
     employee_id = employee_data.get("id")
 
     # Get today's date in YYYY-MM-DD format
-    today = datetime.now().date().isoformat()
-    check_in_time = datetime.now()
+    now = datetime.now()
+    today = now.date().isoformat()
+    check_in_time = now
 
-    # Check if attendance record already exists for today
-    statement = select(Attendance).where(
-        (Attendance.employee_id == employee_id) & (Attendance.date == today)
-    )
-    existing_record = session.exec(statement).first()
-
-    if existing_record:
-        # Update existing record with check-in time
-        logger.info(f"Updating check-in for employee {employee_id} on {today}")
-        existing_record.check_in_time = check_in_time
-        existing_record.status = "present"
-        existing_record.updated_at = datetime.now()
-        session.add(existing_record)
-        session.commit()
-        session.refresh(existing_record)
-        logger.info(f"Employee {employee_id} checked in at {check_in_time}")
-
-        # Publish attendance marked event
-        try:
-            event = EventEnvelope(
-                event_type=EventType.ATTENDANCE_MARKED,
-                data={
-                    "attendance_id": str(existing_record.id),
-                    "employee_id": existing_record.employee_id,
-                    "check_in_time": existing_record.check_in_time.isoformat()
-                    if existing_record.check_in_time
-                    else None,
-                    "check_out_time": existing_record.check_out_time.isoformat()
-                    if existing_record.check_out_time
-                    else None,
-                    "status": existing_record.status,
-                    "date": existing_record.date,
-                },
-                metadata=EventMetadata(user_id=current_user.sub),
-            )
-            await publish_event("attendance-events", event)
-            logger.info(f"Published attendance marked event for: {existing_record.id}")
-        except Exception as e:
-            logger.warning(f"Failed to publish attendance marked event: {e}")
-
-        return existing_record
-    else:
-        # Create new attendance record
-        logger.info(f"Creating new check-in for employee {employee_id} on {today}")
-        new_record = Attendance(
-            employee_id=employee_id,
-            date=today,
-            check_in_time=check_in_time,
-            status="present",
-        )
-        session.add(new_record)
-        session.commit()
-        session.refresh(new_record)
-        logger.info(f"Employee {employee_id} checked in at {check_in_time}")
-
-        # Publish attendance marked event
-        try:
-            event = EventEnvelope(
-                event_type=EventType.ATTENDANCE_MARKED,
-                data={
-                    "attendance_id": str(new_record.id),
-                    "employee_id": new_record.employee_id,
-                    "check_in_time": new_record.check_in_time.isoformat()
-                    if new_record.check_in_time
-                    else None,
-                    "check_out_time": new_record.check_out_time.isoformat()
-                    if new_record.check_out_time
-                    else None,
-                    "status": new_record.status,
-                    "date": new_record.date,
-                },
-                metadata=EventMetadata(user_id=current_user.sub),
-            )
-            await publish_event("attendance-events", event)
-            logger.info(f"Published attendance marked event for: {new_record.id}")
-        except Exception as e:
-            logger.warning(f"Failed to publish attendance marked event: {e}")
+    # Create today's record, or stamp the check-in on the existing one
+    logger.info(f"Recording check-in for employee {employee_id} on {today}")
+    record = await _upsert_check_in(session, employee_id, today, check_in_time)
+    logger.info(f"Employee {employee_id} checked in at {check_in_time}")
 
-        return new_record
+    # Publish attendance check-in event
+    event = _check_in_event(record, current_user.sub)
+    background_tasks.add_task(publish_event, "attendance-events", event)
+    logger.info(f"Queued attendance check-in event for: {record.id}")
+
+    return record
 
 
 @router.post("/check-out/me", response_model=AttendancePublic, status_code=200)
 async def check_out_self(
     session: SessionDep,
     current_user: CurrentUserDep,
+    background_tasks: BackgroundTasks,
 ) -> Attendance:
     """
     Employee self check-out endpoint (simplified - no employee_id required).
@@ -709,6 +765,7 @@ async def check_out_self(
     Args:
         session: Database session (injected)
         current_user: Current authenticated user
+        background_tasks: Background tasks (injected, used to publish events)
 
     Returns:
         Updated attendance record with check-out time
@@ -718,9 +775,9 @@ async def check_out_self(
     """
     logger.info(f"Self check-out initiated by {current_user.email}")
 
-    # Look up employee by current user's email
+    # Look up employee by current user's email; fresh, as it gates the write
     employee_data = await employee_validation_service.get_employee_by_email(
-        current_user.email
+        current_user.email, session=session, fresh=True
     )
     if not employee_data:
         raise HTTPException(
@@ -731,14 +788,13 @@ async def check_out_self(
     employee_id = employee_data.get("id")
 
     # Get today's date in YYYY-MM-DD format
-    today = datetime.now().date().isoformat()
-    check_out_time = datetime.now()
+    now = datetime.now()
+    today = now.date().isoformat()
+    check_out_time = now
 
-    # Find today's attendance record
-    statement = select(Attendance).where(
-        (Attendance.employee_id == employee_id) & (Attendance.date == today)
-    )
-    record = session.exec(statement).first()
+    # Stamp the check-out on today's record
+    logger.info(f"Updating check-out for employee {employee_id} on {today}")
+    record = await _record_check_out(session, employee_id, today, check_out_time)
 
     if not record:
         logger.warning(
@@ -748,31 +804,12 @@ async def check_out_self(
             status_code=404,
             detail="No check-in record found for today. Please check in first.",
         )
-
-    # Update record with check-out time
-    logger.info(f"Updating check-out for employee {employee_id} on {today}")
-    record.check_out_time = check_out_time
-    record.updated_at = datetime.now()
-    session.add(record)
-    session.commit()
-    session.refresh(record)
     logger.info(f"Employee {employee_id} checked out at {check_out_time}")
 
     # Publish attendance updated event
-    try:
-        event = EventEnvelope(
-            event_type=EventType.ATTENDANCE_UPDATED,
-            data={
-                "attendance_id": str(record.id),
-                "employee_id": record.employee_id,
-                "updated_fields": {"check_out_time": check_out_time.isoformat()},
-            },
-            metadata=EventMetadata(user_id=current_user.sub),
-        )
-        await publish_event("attendance-events", event)
-        logger.info(f"Published attendance updated event for: {record.id}")
-    except Exception as e:
-        logger.warning(f"Failed to publish attendance updated event: {e}")
+    event = _check_out_event(record, current_user.sub)
+    background_tasks.add_task(publish_event, "attendance-events", event)
+    logger.info(f"Queued attendance updated event for: {record.id}")
 
     return record
 
@@ -798,7 +835,7 @@ async def get_my_attendance_today(
     # Get employee_id from current user's email
     # We need to find the employee by email
     employee_data = await employee_validation_service.get_employee_by_email(
-        current_user.email
+        current_user.email, session=session
     )
     if not employee_data:
         raise HTTPException(
@@ -812,7 +849,7 @@ async def get_my_attendance_today(
     statement = select(Attendance).where(
         (Attendance.employee_id == employee_id) & (Attendance.date == today)
     )
-    record = session.exec(statement).first()
+    record = (await session.exec(statement)).first()
 
     logger.info(
         f"User {current_user.email} (employee {employee_id}) fetched today's attendance"
@@ -826,8 +863,8 @@ async def get_my_attendance_history(
     current_user: CurrentUserDep,
     offset: int = 0,
     limit: Annotated[int, Query(le=100)] = 100,
-    start_date: str | None = None,
-    end_date: str | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
 ):
     """
     Get current user's attendance history.
@@ -848,7 +885,7 @@ async def get_my_attendance_history(
     """
     # Get employee_id from current user's email
     employee_data = await employee_validation_service.get_employee_by_email(
-        current_user.email
+        current_user.email, session=session
     )
     if not employee_data:
         raise HTTPException(
@@ -860,34 +897,19 @@ async def get_my_attendance_history(
 
     statement = select(Attendance).where(Attendance.employee_id == employee_id)
 
-    # Apply date range filters if provided
+    # Apply date range filters if provided; dates are stored as YYYY-MM-DD strings
     if start_date:
-        try:
-            datetime.fromisoformat(start_date)
-            statement = statement.where(Attendance.date >= start_date)
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail="start_date must be in YYYY-MM-DD format",
-            )
-
+        statement = statement.where(Attendance.date >= start_date.isoformat())
     if end_date:
-        try:
-            datetime.fromisoformat(end_date)
-            statement = statement.where(Attendance.date <= end_date)
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail="end_date must be in YYYY-MM-DD format",
-            )
+        statement = statement.where(Attendance.date <= end_date.isoformat())
 
     statement = statement.offset(offset).limit(limit)
-    records = session.exec(statement).all()
+    records = (await session.exec(statement)).all()
 
     logger.info(
         f"User {current_user.email} (employee {employee_id}) fetched {len(records)} attendance records"
     )
-    return list(records)
+    return records
 
 
 @router.get("/dashboard/summary", response_model=dict)
@@ -895,19 +917,10 @@ async def get_attendance_dashboard(
     session: SessionDep,
     current_user: Annotated[
         TokenData,
-        Depends(
-            require_role(
-                "HR-Administrators",
-                "HR-Managers",
-                "Team-Managers",
-                "HR_Administrators",
-                "HR_Managers",
-                "Manager",
-                "manager",
-            )
-        ),
+        Depends(require_role(*sorted(HR_MANAGER_ROLES))),
     ],
-    date: str | None = None,
+    dashboard_date: Annotated[date | None, Query(alias="date")] = None,
+    include_records: bool = True,
 ):
     """
     Get attendance dashboard summary for managers.
@@ -918,55 +931,65 @@ async def get_attendance_dashboard(
     Args:
         session: Database session (injected)
         current_user: Current authenticated user (Manager role required)
-        date: Optional date in YYYY-MM-DD format (defaults to today)
+        dashboard_date: Optional date in YYYY-MM-DD format, sent as the date
+            query parameter (defaults to today)
+        include_records: Whether to include the day's attendance records
 
     Returns:
         Dashboard summary with attendance statistics
     """
-    target_date = date or datetime.now().date().isoformat()
-
-    # Validate date format
-    try:
-        datetime.fromisoformat(target_date)
-    except ValueError:
-        raise HTTPException(
-            status_code=400,
-            detail="date must be in YYYY-MM-DD format",
-        )
-
-    # Get all attendance records for the target date
-    statement = select(Attendance).where(Attendance.date == target_date)
-    records = session.exec(statement).all()
+    target_date = (dashboard_date or date.today()).isoformat()
+
+    # Count the day's records per status without loading them, while the
+    # active employee count (a blocking lookup) runs on a worker thread
+    status_counts, total_employees = await asyncio.gather(
+        session.exec(
+            select(Attendance.status, func.count())
+            .where(Attendance.date == target_date)
+            .group_by(Attendance.status)
+        ),
+        asyncio.to_thread(employee_validation_service.get_active_employee_count),
+    )
+    counts = dict(status_counts.all())
 
     # Calculate statistics
-    total_employees_checked_in = len(records)
-    present_count = sum(1 for r in records if r.status == "present")
-    absent_count = sum(1 for r in records if r.status == "absent")
-    late_count = sum(1 for r in records if r.status == "late")
-    pending_count = sum(1 for r in records if r.status == "pending")
-
-    # Get employees who haven't checked in yet
-    # Get active employee count from cache
-    from app.core.employee_service import employee_validation_service as emp_service
-
-    total_employees = emp_service.get_active_employee_count()
+    total_employees_checked_in = sum(counts.values())
     not_checked_in = total_employees - total_employees_checked_in
 
     logger.info(
         f"Manager {current_user.email} accessed dashboard for date {target_date}"
     )
 
-    return {
+    summary = {
         "date": target_date,
         "total_employees": total_employees,
         "checked_in": total_employees_checked_in,
         "not_checked_in": not_checked_in,
-        "present": present_count,
-        "absent": absent_count,
-        "late": late_count,
-        "pending": pending_count,
-        "records": [AttendancePublic.model_validate(r) for r in records],
+        "present": counts.get("present", 0),
+        "absent": counts.get("absent", 0),
+        "late": counts.get("late", 0),
+        "pending": counts.get("pending", 0),
     }
+    if not include_records:
+        summary["records"] = []
+        return summary
+
+    # Stream the records, which cover every employee who checked in that day.
+    # The first chunk is fetched here, before any headers are sent, so a failing
+    # query is answered with an error status instead of a cut-off 200 body.
+    statement = select(*PUBLIC_COLUMNS).where(Attendance.date == target_date)
+    result = await session.stream(
+        statement.execution_options(yield_per=DASHBOARD_YIELD_PER)
+    )
+    try:
+        first = await result.fetchmany(DASHBOARD_YIELD_PER)
+    except Exception:
+        await result.close()
+        raise
+    return StreamingResponse(
+        _stream_dashboard(result, first, summary),
+        media_type="application/json",
+    )
 
 
 # auth check
@@ -10,11 +10,11 @@ Provides caching utilities for:
 All cached data has TTL to ensure freshness while reducing database load.
 """
 
-import json
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, Optional
 
+import orjson
 import redis
 from redis import Redis
 
@@ -138,9 +138,9 @@ def get_from_cache(key: str) -> Optional[Any]:
         client = RedisClient.get_client()
         data = client.get(key)
         if data:
-            return json.loads(data)
+            return orjson.loads(data)
         return None
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Cache JSON decode error for key {key}: {e}")
         return None
     except Exception as e:
@@ -162,7 +162,7 @@ def set_to_cache(key: str, value: Any, ttl: int = CACHE_TTL_MEDIUM) -> bool:
     """
     try:
         client = RedisClient.get_client()
-        serialized = json.dumps(value, default=json_serializer)
+        serialized = orjson.dumps(value, default=json_serializer)
         client.setex(key, ttl, serialized)
         return True
     except Exception as e:
@@ -441,6 +441,93 @@ def invalidate_employee_attendance(employee_id: int) -> bool:
     return True
 
 
+# Monthly Summary Cache Functions
+
+
+def get_monthly_summary_key(employee_id: int, month: str, include_records: bool) -> str:
+    """
+    Build the cache key for an employee's monthly summary.
+
+    Summaries with and without their records are cached separately.
+
+    Args:
+        employee_id: Employee ID
+        month: Month in YYYY-MM format
+        include_records: Whether the summary includes its attendance records
+
+    Returns:
+        Cache key string
+    """
+    variant = "full" if include_records else "counts"
+    return f"{CacheKeys.EMPLOYEE_MONTHLY_PREFIX}:{employee_id}:{month}:{variant}"
+
+
+def cache_monthly_summary(
+    employee_id: int,
+    month: str,
+    include_records: bool,
+    summary: dict,
+    ttl: int = CACHE_TTL_SHORT,
+) -> bool:
+    """
+    Cache an employee's monthly summary.
+
+    Args:
+        employee_id: Employee ID
+        month: Month in YYYY-MM format
+        include_records: Whether the summary includes its attendance records
+        summary: Monthly summary data
+        ttl: Time-to-live in seconds
+
+    Returns:
+        True if successful
+    """
+    key = get_monthly_summary_key(employee_id, month, include_records)
+    return set_to_cache(key, summary, ttl=ttl)
+
+
+def get_cached_monthly_summary(
+    employee_id: int, month: str, include_records: bool
+) -> Optional[dict]:
+    """
+    Get a cached monthly summary for an employee.
+
+    Args:
+        employee_id: Employee ID
+        month: Month in YYYY-MM format
+        include_records: Whether the summary includes its attendance records
+
+    Returns:
+        Cached summary data or None
+    """
+    return get_from_cache(get_monthly_summary_key(employee_id, month, include_records))
+
+
+def invalidate_monthly_summary(employee_id: int, month: str) -> bool:
+    """
+    Invalidate both cached variants of an employee's monthly summary.
+
+    Args:
+        employee_id: Employee ID
+        month: Month in YYYY-MM format
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        client = RedisClient.get_client()
+        client.delete(
+            get_monthly_summary_key(employee_id, month, True),
+            get_monthly_summary_key(employee_id, month, False),
+        )
+        return True
+    except Exception as e:
+        logger.error(
+            f"Cache delete error for monthly summary {employee_id}:{month}: {e}"
+        )
+        return False
+
+
 # Today's Attendance Tracking
 
 
@@ -8,6 +8,7 @@ and external service integrations.
 
 from typing import List
 
+from pydantic import AnyHttpUrl
 from pydantic_settings import BaseSettings
 
 
@@ -35,6 +36,9 @@ class Settings(BaseSettings):
     # Kafka Settings
     KAFKA_BOOTSTRAP_SERVERS: str = "localhost:9092"
     KAFKA_ENABLED: bool = True
+    KAFKA_PRODUCER_LINGER_MS: int = 20  # Wait to batch outbound events
+    KAFKA_PRODUCER_BATCH_SIZE: int = 65536  # Max bytes per partition batch
+    KAFKA_PRODUCER_COMPRESSION: str = "lz4"  # none, gzip, snappy, lz4 or zstd
 
     # CORS Settings
     CORS_ORIGINS: str = "https://localhost,http://localhost:3000"
@@ -50,7 +54,7 @@ class Settings(BaseSettings):
         return [self.CORS_ORIGINS]
 
     # External Services
-    EMPLOYEE_SERVICE_URL: str = "http://localhost:8000"
+    EMPLOYEE_SERVICE_URL: AnyHttpUrl = AnyHttpUrl("http://localhost:8000")
     EMPLOYEE_SERVICE_TIMEOUT: int = 5
 
     LEAVE_SERVICE_URL: str = "http://localhost:8003"
@@ -87,6 +91,11 @@ class Settings(BaseSettings):
         """Generate MySQL database URL."""
         return f"mysql+mysqldb://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}?charset={self.DB_CHARSET}"
 
+    @property
+    def async_database_url(self) -> str:
+        """Generate MySQL database URL for the async (aiomysql) driver."""
+        return f"mysql+aiomysql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}?charset={self.DB_CHARSET}"
+
     @property
     def database_url_without_db(self) -> str:
         """Generate MySQL URL without database name (for initial connection)."""
@@ -3,10 +3,12 @@ Database configuration and session management.
 Handles database engine creation, session management, and table initialization.
 """
 
-from typing import Generator
+from typing import AsyncIterator
 
-from sqlalchemy import text
-from sqlmodel import Session, SQLModel, create_engine
+from sqlalchemy import exc, inspect, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
 from app.core.logging import get_logger
@@ -17,6 +19,11 @@ from app.models.employee import EmployeeCache  # noqa: F401
 
 logger = get_logger(__name__)
 
+# Errors meaning the database was unreachable or aborted the transaction (lost
+# connection, lock wait timeout, deadlock, pool exhausted); the same work can
+# succeed when retried later
+TRANSIENT_DB_ERRORS = (exc.OperationalError, exc.InterfaceError, exc.TimeoutError)
+
 
 def create_database() -> None:
     """
@@ -45,6 +52,46 @@ def create_db_and_tables() -> None:
     create_database()
     SQLModel.metadata.create_all(engine)
     logger.info("Database tables created successfully")
+    verify_unique_indexes()
+
+
+def verify_unique_indexes() -> None:
+    """
+    Check that every unique index declared on the models exists in the database.
+
+    create_all does not add indexes to tables that already exist, and the
+    upserts rely on these indexes (e.g. one attendance record per employee and
+    day). Startup fails instead of letting duplicate rows build up.
+
+    Raises:
+        RuntimeError: If a table is missing one of its unique indexes
+    """
+    inspector = inspect(engine)
+    missing = []
+    for table in SQLModel.metadata.sorted_tables:
+        existing = {
+            tuple(index["column_names"])
+            for index in inspector.get_indexes(table.name)
+            if index["unique"]
+        }
+        existing.update(
+            tuple(constraint["column_names"])
+            for constraint in inspector.get_unique_constraints(table.name)
+        )
+        for index in table.indexes:
+            columns = tuple(column.name for column in index.columns)
+            if index.unique and columns not in existing:
+                missing.append(
+                    f"CREATE UNIQUE INDEX {index.name} "
+                    f"ON {table.name} ({', '.join(columns)})"
+                )
+
+    if missing:
+        for statement in missing:
+            logger.error(f"Missing unique index, apply: {statement}")
+        raise RuntimeError(
+            f"{len(missing)} unique index(es) missing; see the log for the DDL"
+        )
 
 
 # Create the database engine
@@ -55,14 +102,27 @@ engine = create_engine(
     pool_recycle=3600,  # Recycle connections after 1 hour
 )
 
+# Async engine for request handlers, so DB round trips don't hold a
+# worker thread while the event loop could be serving other requests
+async_engine = create_async_engine(
+    settings.async_database_url,
+    echo=settings.DEBUG,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False
+)
+
 
-def get_session() -> Generator[Session, None, None]:
+async def get_session() -> AsyncIterator[AsyncSession]:
     """
-    Dependency that provides a database session.
+    Dependency that provides an async database session.
     Automatically handles session lifecycle and cleanup.
 
     Yields:
-        Session: SQLModel database session
+        AsyncSession: SQLModel async database session
     """
-    with Session(engine) as session:
+    async with AsyncSessionLocal() as session:
         yield session
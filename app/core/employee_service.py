@@ -8,17 +8,91 @@ This service provides employee validation and data retrieval with a two-tier app
 This ensures reliable employee validation even when services are temporarily unavailable.
 """
 
+from threading import Lock
 from typing import Optional
 
-from sqlmodel import Session, select
+from cachetools import TTLCache
+from sqlmodel import Session, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.api.clients.employee_service import employee_service as http_client
+from app.api.clients.employee_service import get_employee_service
 from app.core.database import engine
 from app.core.logging import get_logger
 from app.models.employee import EmployeeCache
 
 logger = get_logger(__name__)
 
+# Employee statuses that count as an existing, active employee
+ACTIVE_EMPLOYEE_STATUSES = frozenset({"active", "on_leave"})
+
+# In-process cache of employee lookups, in front of the EmployeeCache table.
+# Entries are invalidated by the Kafka employee handlers, which run on the
+# consumer thread, so access goes through a lock. Only the replica whose
+# consumer handled an event invalidates its entries; the others keep serving
+# the old record for up to EMPLOYEE_LOOKUP_TTL seconds, so checks that gate
+# writes pass fresh=True to read the shared table instead.
+EMPLOYEE_LOOKUP_TTL = 30
+_lookup_lock = Lock()
+_lookup_by_id: TTLCache = TTLCache(maxsize=10_000, ttl=EMPLOYEE_LOOKUP_TTL)
+# Keyed by lower-cased email, matching the case-insensitive column collation
+_lookup_by_email: TTLCache = TTLCache(maxsize=10_000, ttl=EMPLOYEE_LOOKUP_TTL)
+
+# Active headcount for the dashboard; it only moves with employee events,
+# so a short TTL spares a COUNT on every dashboard load.
+ACTIVE_COUNT_TTL = 60
+_active_count: TTLCache = TTLCache(maxsize=1, ttl=ACTIVE_COUNT_TTL)
+
+
+def _remember(employee_data: dict) -> None:
+    """Store a looked-up employee in the in-process lookup cache."""
+    with _lookup_lock:
+        if employee_data.get("id") is not None:
+            _lookup_by_id[employee_data["id"]] = employee_data
+        if employee_data.get("email"):
+            _lookup_by_email[employee_data["email"].lower()] = employee_data
+
+
+async def _get_cached_employee(
+    session: Optional[AsyncSession], employee_id: int
+) -> Optional[EmployeeCache]:
+    """Read an EmployeeCache row on the caller's session, or a new one if None."""
+    if session is not None:
+        return await session.get(EmployeeCache, employee_id)
+    with Session(engine) as own_session:
+        return own_session.get(EmployeeCache, employee_id)
+
+
+async def _find_cached_employees(
+    session: Optional[AsyncSession], statement
+) -> list[EmployeeCache]:
+    """Run an EmployeeCache query on the caller's session, or a new one if None."""
+    if session is not None:
+        return list((await session.exec(statement)).all())
+    with Session(engine) as own_session:
+        return list(own_session.exec(statement).all())
+
+
+def _employee_to_dict(employee: EmployeeCache) -> dict:
+    """Convert a cached employee row to the employee service's dict shape."""
+    return {
+        "id": employee.id,
+        "user_id": employee.user_id,
+        "email": employee.email,
+        "first_name": employee.first_name,
+        "last_name": employee.last_name,
+        "full_name": employee.full_name,
+        "role": employee.role,
+        "job_title": employee.job_title,
+        "department": employee.department,
+        "team": employee.team,
+        "manager_id": employee.manager_id,
+        "employment_type": employee.employment_type,
+        "status": employee.status,
+        "joining_date": employee.joining_date.isoformat()
+        if employee.joining_date
+        else None,
+    }
+
 
 class EmployeeValidationService:
     """
@@ -43,20 +117,25 @@ class EmployeeValidationService:
         """
         try:
             # Check cache first
+            # Only the status is needed, so skip building an EmployeeCache
             with Session(engine) as session:
-                employee = session.get(EmployeeCache, employee_id)
+                status = session.exec(
+                    select(EmployeeCache.status).where(EmployeeCache.id == employee_id)
+                ).first()
 
-                if employee:
+                if status is not None:
                     # Employee found in cache
-                    is_active = employee.status in ["active", "on_leave"]
+                    is_active = status in ACTIVE_EMPLOYEE_STATUSES
                     if is_active:
-                        logger.info(
-                            f"Employee {employee_id} found in cache (status: {employee.status})"
+                        logger.debug(
+                            "Employee %s found in cache (status: %s)",
+                            employee_id,
+                            status,
                         )
                         return True
                     else:
                         logger.info(
-                            f"Employee {employee_id} found in cache but inactive (status: {employee.status})"
+                            f"Employee {employee_id} found in cache but inactive (status: {status})"
                         )
                         return False
 
@@ -71,46 +150,98 @@ class EmployeeValidationService:
         return False
 
     @staticmethod
-    async def verify_employee_exists_async(employee_id: int) -> bool:
+    def invalidate(employee_id: int) -> None:
+        """
+        Drop an employee from the in-process lookup cache.
+
+        Called by the employee event handlers after they change the
+        EmployeeCache row, so the next lookup reads the new data.
+
+        Args:
+            employee_id: Employee ID to invalidate
+        """
+        with _lookup_lock:
+            employee_data = _lookup_by_id.pop(employee_id, None)
+            if employee_data and employee_data.get("email"):
+                _lookup_by_email.pop(employee_data["email"].lower(), None)
+            _active_count.clear()
+
+    @staticmethod
+    def clear_lookup_cache() -> None:
+        """Drop all entries from the in-process lookup and count caches."""
+        with _lookup_lock:
+            _lookup_by_id.clear()
+            _lookup_by_email.clear()
+            _active_count.clear()
+
+    @staticmethod
+    def is_active(employee_data: dict) -> bool:
+        """
+        Check whether retrieved employee data belongs to an active employee.
+
+        Records without a status (e.g. from an older employee service) are
+        treated as active, matching the HTTP existence check.
+
+        Args:
+            employee_data: Employee data dictionary from get_employee()
+
+        Returns:
+            True if the employee is active or on leave, False otherwise
+        """
+        return employee_data.get("status", "active") in ACTIVE_EMPLOYEE_STATUSES
+
+    @staticmethod
+    async def verify_employee_exists_async(
+        employee_id: int, session: Optional[AsyncSession] = None
+    ) -> bool:
         """
         Async version of verify_employee_exists with HTTP fallback.
 
         Args:
             employee_id: Employee ID to verify
+            session: Request database session to read the cache with; a new
+                session is opened if omitted
 
         Returns:
             True if employee exists and is active, False otherwise
         """
+        with _lookup_lock:
+            employee_data = _lookup_by_id.get(employee_id)
+        if employee_data is not None:
+            return EmployeeValidationService.is_active(employee_data)
+
         try:
             # Check cache first
-            with Session(engine) as session:
-                employee = session.get(EmployeeCache, employee_id)
-
-                if employee:
-                    # Employee found in cache
-                    is_active = employee.status in ["active", "on_leave"]
-                    if is_active:
-                        logger.info(
-                            f"Employee {employee_id} found in cache (status: {employee.status})"
-                        )
-                        return True
-                    else:
-                        logger.info(
-                            f"Employee {employee_id} found in cache but inactive (status: {employee.status})"
-                        )
-                        return False
-
-                # Not in cache, fall back to HTTP
-                logger.warning(
-                    f"Employee {employee_id} not in cache, falling back to HTTP call"
-                )
+            employee = await _get_cached_employee(session, employee_id)
+
+            if employee:
+                # Employee found in cache
+                _remember(_employee_to_dict(employee))
+                is_active = employee.status in ACTIVE_EMPLOYEE_STATUSES
+                if is_active:
+                    logger.debug(
+                        "Employee %s found in cache (status: %s)",
+                        employee_id,
+                        employee.status,
+                    )
+                    return True
+                else:
+                    logger.info(
+                        f"Employee {employee_id} found in cache but inactive (status: {employee.status})"
+                    )
+                    return False
+
+            # Not in cache, fall back to HTTP
+            logger.warning(
+                f"Employee {employee_id} not in cache, falling back to HTTP call"
+            )
 
         except Exception as e:
             logger.error(f"Error checking cache for employee {employee_id}: {e}")
 
         # HTTP fallback
         try:
-            exists = await http_client.verify_employee_exists(employee_id)
+            exists = await get_employee_service().verify_employee_exists(employee_id)
             if exists:
                 logger.info(
                     f"Employee {employee_id} verified via HTTP (not in cache yet)"
@@ -125,7 +256,11 @@ class EmployeeValidationService:
             return False
 
     @staticmethod
-    async def get_employee(employee_id: int) -> Optional[dict]:
+    async def get_employee(
+        employee_id: int,
+        session: Optional[AsyncSession] = None,
+        fresh: bool = False,
+    ) -> Optional[dict]:
         """
         Get employee details.
 
@@ -133,57 +268,106 @@ class EmployeeValidationService:
 
         Args:
             employee_id: Employee ID to retrieve
+            session: Request database session to read the cache with; a new
+                session is opened if omitted
+            fresh: Skip the in-process lookup cache and read the EmployeeCache
+                table, which every replica's consumer keeps current
 
         Returns:
             Employee data dictionary or None if not found
         """
+        if not fresh:
+            with _lookup_lock:
+                employee_data = _lookup_by_id.get(employee_id)
+            if employee_data is not None:
+                return employee_data
+
         try:
             # Check cache first
-            with Session(engine) as session:
-                employee = session.get(EmployeeCache, employee_id)
-
-                if employee:
-                    logger.info(f"Employee {employee_id} found in cache")
-                    return {
-                        "id": employee.id,
-                        "user_id": employee.user_id,
-                        "email": employee.email,
-                        "first_name": employee.first_name,
-                        "last_name": employee.last_name,
-                        "full_name": employee.full_name,
-                        "role": employee.role,
-                        "job_title": employee.job_title,
-                        "department": employee.department,
-                        "team": employee.team,
-                        "manager_id": employee.manager_id,
-                        "employment_type": employee.employment_type,
-                        "status": employee.status,
-                        "joining_date": employee.joining_date.isoformat()
-                        if employee.joining_date
-                        else None,
-                    }
+            employee = await _get_cached_employee(session, employee_id)
 
-                logger.info(
-                    f"Employee {employee_id} not in cache, falling back to HTTP"
-                )
+            if employee:
+                logger.debug("Employee %s found in cache", employee_id)
+                employee_data = _employee_to_dict(employee)
+                _remember(employee_data)
+                return employee_data
+
+            logger.info(f"Employee {employee_id} not in cache, falling back to HTTP")
 
         except Exception as e:
             logger.error(f"Error checking cache for employee {employee_id}: {e}")
 
         # HTTP fallback
         try:
-            employee_data = await http_client.get_employee(employee_id)
+            employee_data = await get_employee_service().get_employee(employee_id)
             if employee_data:
                 logger.info(
                     f"Employee {employee_id} retrieved via HTTP (not in cache yet)"
                 )
+                _remember(employee_data)
             return employee_data
         except Exception as e:
             logger.error(f"HTTP fallback failed for employee {employee_id}: {e}")
             return None
 
     @staticmethod
-    async def get_employee_by_email(email: str) -> Optional[dict]:
+    async def get_employees(
+        employee_ids: list[int], session: Optional[AsyncSession] = None
+    ) -> dict[int, Optional[dict]]:
+        """
+        Get details for several employees at once.
+
+        Serves what it can from the in-process lookup cache, reads the rest
+        of the cached employees in one query, then fetches the remainder from
+        the employee management service in a single bulk request.
+
+        Args:
+            employee_ids: Employee IDs to retrieve
+            session: Request database session to read the cache with; a new
+                session is opened if omitted
+
+        Returns:
+            Mapping of employee ID to employee data (None if not found)
+        """
+        employees: dict[int, Optional[dict]] = dict.fromkeys(employee_ids)
+        with _lookup_lock:
+            for employee_id in employees:
+                employees[employee_id] = _lookup_by_id.get(employee_id)
+
+        uncached = [i for i, data in employees.items() if data is None]
+        if not uncached:
+            return employees
+
+        try:
+            statement = select(EmployeeCache).where(EmployeeCache.id.in_(uncached))
+            for employee in await _find_cached_employees(session, statement):
+                employees[employee.id] = _employee_to_dict(employee)
+                _remember(employees[employee.id])
+        except Exception as e:
+            logger.error(f"Error checking cache for employees {employee_ids}: {e}")
+
+        missing = [i for i, data in employees.items() if data is None]
+        if missing:
+            logger.info(
+                f"{len(missing)} employees not in cache, falling back to HTTP"
+            )
+            try:
+                fetched = await get_employee_service().get_employees_by_ids(missing)
+            except Exception as e:
+                logger.error(f"HTTP fallback failed for employees {missing}: {e}")
+            else:
+                for employee_data in fetched.values():
+                    if employee_data:
+                        _remember(employee_data)
+                employees.update(fetched)
+        return employees
+
+    @staticmethod
+    async def get_employee_by_email(
+        email: str,
+        session: Optional[AsyncSession] = None,
+        fresh: bool = False,
+    ) -> Optional[dict]:
         """
         Get employee details by email.
 
@@ -191,51 +375,48 @@ class EmployeeValidationService:
 
         Args:
             email: Employee email to search for
+            session: Request database session to read the cache with; a new
+                session is opened if omitted
+            fresh: Skip the in-process lookup cache and read the EmployeeCache
+                table, which every replica's consumer keeps current
 
         Returns:
             Employee data dictionary or None if not found
         """
+        if not fresh:
+            with _lookup_lock:
+                employee_data = _lookup_by_email.get(email.lower())
+            if employee_data is not None:
+                return employee_data
+
         try:
             # Check cache first
-            with Session(engine) as session:
-                statement = select(EmployeeCache).where(EmployeeCache.email == email)
-                employee = session.exec(statement).first()
-
-                if employee:
-                    logger.info(f"Employee with email {email} found in cache")
-                    return {
-                        "id": employee.id,
-                        "user_id": employee.user_id,
-                        "email": employee.email,
-                        "first_name": employee.first_name,
-                        "last_name": employee.last_name,
-                        "full_name": employee.full_name,
-                        "role": employee.role,
-                        "job_title": employee.job_title,
-                        "department": employee.department,
-                        "team": employee.team,
-                        "manager_id": employee.manager_id,
-                        "employment_type": employee.employment_type,
-                        "status": employee.status,
-                        "joining_date": employee.joining_date.isoformat()
-                        if employee.joining_date
-                        else None,
-                    }
+            statement = (
+                select(EmployeeCache).where(EmployeeCache.email == email).limit(1)
+            )
+            found = await _find_cached_employees(session, statement)
 
-                logger.info(
-                    f"Employee with email {email} not in cache, falling back to HTTP"
-                )
+            if found:
+                logger.debug("Employee with email %s found in cache", email)
+                employee_data = _employee_to_dict(found[0])
+                _remember(employee_data)
+                return employee_data
+
+            logger.info(
+                f"Employee with email {email} not in cache, falling back to HTTP"
+            )
 
         except Exception as e:
             logger.error(f"Error checking cache for employee email {email}: {e}")
 
         # HTTP fallback
         try:
-            employee_data = await http_client.get_employee_by_email(email)
+            employee_data = await get_employee_service().get_employee_by_email(email)
             if employee_data:
                 logger.info(
                     f"Employee with email {email} retrieved via HTTP (not in cache yet)"
                 )
+                _remember(employee_data)
             return employee_data
         except Exception as e:
             logger.error(f"HTTP fallback failed for employee email {email}: {e}")
@@ -253,9 +434,8 @@ class EmployeeValidationService:
         """
         try:
             with Session(engine) as session:
-                statement = select(EmployeeCache)
-                employees = session.exec(statement).all()
-                count = len(employees)
+                statement = select(func.count()).select_from(EmployeeCache)
+                count = session.exec(statement).one()
                 logger.debug(f"Employee cache contains {count} records")
                 return count
         except Exception as e:
@@ -267,22 +447,34 @@ class EmployeeValidationService:
         """
         Get the count of active employees in cache.
 
+        The count is kept for ACTIVE_COUNT_TTL seconds and dropped whenever
+        an employee is invalidated.
+
         Returns:
             Number of active employees
         """
+        with _lookup_lock:
+            count = _active_count.get("active")
+        if count is not None:
+            return count
+
         try:
             with Session(engine) as session:
-                statement = select(EmployeeCache).where(
-                    EmployeeCache.status == "active"
+                statement = (
+                    select(func.count())
+                    .select_from(EmployeeCache)
+                    .where(EmployeeCache.status == "active")
                 )
-                employees = session.exec(statement).all()
-                count = len(employees)
-                logger.debug(f"Employee cache contains {count} active employees")
-                return count
+                count = session.exec(statement).one()
         except Exception as e:
             logger.error(f"Error counting active employees: {e}")
             return 0
 
+        logger.debug(f"Employee cache contains {count} active employees")
+        with _lookup_lock:
+            _active_count["active"] = count
+        return count
+
 
 # Create singleton instance
 employee_validation_service = EmployeeValidationService()
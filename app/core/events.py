@@ -9,7 +9,7 @@ Events are categorized into:
 - Audit events
 """
 
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from enum import Enum
 from typing import Any, Optional
 from uuid import uuid4
@@ -50,7 +50,7 @@ class EventMetadata(BaseModel):
     """Metadata attached to every event for tracing and correlation."""
 
     source_service: str = "attendance-management-service"
-    correlation_id: str = Field(default_factory=lambda: str(uuid4()))
+    correlation_id: str = Field(default_factory=lambda: uuid4().hex)
     causation_id: Optional[str] = None
     actor_user_id: Optional[str] = None
     actor_role: Optional[str] = None
@@ -64,9 +64,13 @@ class EventEnvelope(BaseModel):
     Provides consistent structure for Kafka messages.
     """
 
-    event_id: str = Field(default_factory=lambda: str(uuid4()))
+    event_id: str = Field(default_factory=lambda: uuid4().hex)
     event_type: EventType
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat(
+            timespec="milliseconds"
+        )
+    )
     version: str = "1.0"
     data: dict[str, Any]
     metadata: EventMetadata = Field(default_factory=EventMetadata)
@@ -349,7 +353,7 @@ def create_event(
     metadata = EventMetadata(
         actor_user_id=actor_user_id,
         actor_role=actor_role,
-        correlation_id=correlation_id or str(uuid4()),
+        correlation_id=correlation_id or uuid4().hex,
     )
 
     return EventEnvelope(
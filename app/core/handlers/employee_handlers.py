@@ -6,14 +6,19 @@ and maintain a local cache of employee data for validation and attendance operat
 """
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable, Optional
 
+from cachetools import LRUCache
+from sqlalchemy import update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlmodel import Session, select
 
 from app.core.config import settings
-from app.core.database import engine
+from app.core.database import TRANSIENT_DB_ERRORS, engine
+from app.core.employee_service import employee_validation_service
 from app.core.kafka import KafkaConsumer
 from app.core.logging import get_logger
+from app.core.timeutils import utcnow
 from app.models.employee import EmployeeCache
 
 logger = get_logger(__name__)
@@ -27,332 +32,433 @@ EMPLOYEE_TERMINATED_TOPIC = "employee-terminated"
 EMPLOYEE_SUSPENDED_TOPIC = "employee-suspended"
 EMPLOYEE_ACTIVATED_TOPIC = "employee-activated"
 
+# IDs of recently applied events, so Kafka redeliveries (after a rebalance or
+# a replayed batch) are dropped before touching the database. Handlers only
+# run on the consumer thread, so no lock is needed.
+_recent_events: LRUCache = LRUCache(maxsize=4096)
 
-def handle_employee_created(event_data: dict[str, Any]):
-    """
-    Handle employee.created event from Employee Management Service.
-
-    Creates or updates the employee cache with the new employee data.
-    """
-    try:
-        data = event_data.get("data", {})
-        employee_id = data.get("employee_id")
 
-        if not employee_id:
-            logger.error("Employee created event missing employee_id")
-            return
+# Applies one (coalesced) event to the employee's cache row, which is None if
+# the employee is not cached yet; returns whether the cache was changed
+ApplyEvent = Callable[[Session, int, Optional[EmployeeCache], dict[str, Any]], bool]
 
-        logger.info(f"Processing employee.created event for employee {employee_id}")
+# Writes a batch of coalesced events, keyed by employee ID, to the cache;
+# returns the IDs of the employees whose cache rows were changed
+WriteBatch = Callable[[Session, dict[int, dict[str, Any]]], list[int]]
 
-        # Extract employee data from event
-        email = data.get("email", "")
-        first_name = data.get("first_name", "")
-        last_name = data.get("last_name", "")
-        full_name = f"{first_name} {last_name}".strip()
-
-        # Create employee cache record
-        with Session(engine) as session:
-            # Check if employee already exists in cache
-            existing = session.get(EmployeeCache, employee_id)
-
-            if existing:
-                logger.warning(
-                    f"Employee {employee_id} already exists in cache, updating instead"
-                )
-                # Update existing record
-                existing.user_id = data.get("user_id")
-                existing.email = email
-                existing.first_name = first_name
-                existing.last_name = last_name
-                existing.full_name = full_name
-                existing.role = data.get("role", "employee")
-                existing.job_title = data.get("job_title", "")
-                existing.department = data.get("department")
-                existing.team = data.get("team")
-                existing.manager_id = data.get("manager_id")
-                existing.employment_type = data.get("employment_type", "permanent")
-                existing.status = "active"
-                existing.joining_date = _parse_date(data.get("joining_date"))
-                existing.updated_at = datetime.utcnow()
-                existing.synced_at = datetime.utcnow()
-
-                session.add(existing)
-                session.commit()
-                logger.info(f"Updated existing employee cache for {employee_id}")
-            else:
-                # Create new record
-                employee_cache = EmployeeCache(
-                    id=employee_id,
-                    user_id=data.get("user_id"),
-                    email=email,
-                    first_name=first_name,
-                    last_name=last_name,
-                    full_name=full_name,
-                    role=data.get("role", "employee"),
-                    job_title=data.get("job_title", ""),
-                    department=data.get("department"),
-                    team=data.get("team"),
-                    manager_id=data.get("manager_id"),
-                    employment_type=data.get("employment_type", "permanent"),
-                    status="active",
-                    joining_date=_parse_date(data.get("joining_date")),
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                    synced_at=datetime.utcnow(),
-                )
 
-                session.add(employee_cache)
-                session.commit()
-                logger.info(
-                    f"Successfully created employee cache for {employee_id} ({email})"
+def _handle_batch(
+    event_name: str,
+    events: list[dict[str, Any]],
+    write: WriteBatch,
+    merge: Optional[Callable[[dict, dict], dict]] = None,
+):
+    """
+    Apply a batch of events of one type to the employee cache.
+
+    Events already applied recently, or repeated within the batch, are
+    skipped by event_id. The rest are
+    coalesced per employee so each row is written once: the latest event
+    wins, unless ``merge`` combines it with the earlier ones. Malformed
+    events are logged and dropped. The batch is committed in one
+    transaction. If it fails, its events are retried one at a time so a
+    single bad event does not drop the rest. Transient database errors are
+    raised instead, so the consumer does not commit the events and consumes
+    them again.
+
+    Args:
+        event_name: Event name used in log messages (e.g. "created")
+        events: Kafka event payloads, in the order they were consumed
+        write: Function writing the coalesced events in the given session
+        merge: Optional function combining an earlier event's data with a
+            later one for the same employee
+    """
+    latest: dict[int, dict[str, Any]] = {}
+    # Original events per employee, so a failed batch is retried with their
+    # event_ids intact
+    sources: dict[int, list[dict[str, Any]]] = {}
+    applied = set()
+    for event_data in events:
+        # The payload comes straight from Kafka, so any part of it may have
+        # the wrong shape (e.g. "data": null or a non-object message)
+        try:
+            event_id = event_data.get("event_id")
+            key = (event_name, event_id)
+            if event_id and (key in _recent_events or key in applied):
+                logger.debug(
+                    "Skipping already applied employee.%s event %s",
+                    event_name,
+                    event_id,
                 )
+                continue
 
-    except Exception as e:
-        logger.error(f"Error handling employee.created event: {e}", exc_info=True)
+            data = event_data.get("data") or {}
+            employee_id = data.get("employee_id")
 
+            if not employee_id:
+                logger.error("Employee %s event missing employee_id", event_name)
+                continue
 
-def handle_employee_updated(event_data: dict[str, Any]):
-    """
-    Handle employee.updated event from Employee Management Service.
+            if merge and employee_id in latest:
+                data = merge(latest[employee_id], data)
+        except (AttributeError, TypeError) as e:
+            logger.error("Skipping malformed employee.%s event: %s", event_name, e)
+            continue
 
-    Updates the employee cache with the changed fields.
-    """
-    try:
-        data = event_data.get("data", {})
-        employee_id = data.get("employee_id")
+        if event_id:
+            applied.add(key)
+        latest[employee_id] = data
+        sources.setdefault(employee_id, []).append(event_data)
 
-        if not employee_id:
-            logger.error("Employee updated event missing employee_id")
-            return
+    if not latest:
+        return
 
-        logger.info(f"Processing employee.updated event for employee {employee_id}")
+    logger.info(
+        "Processing %d employee.%s events for %d employees",
+        len(events),
+        event_name,
+        len(latest),
+    )
 
+    try:
         with Session(engine) as session:
-            employee = session.get(EmployeeCache, employee_id)
-
-            if not employee:
-                logger.warning(
-                    f"Employee {employee_id} not found in cache, cannot update. "
-                    f"Will try to fetch from employee service."
-                )
-                # If employee doesn't exist, we might have missed the creation event
-                # Try to create it with the data we have
-                email = data.get("email", "")
-                first_name = data.get("first_name", "")
-                last_name = data.get("last_name", "")
-
-                if email and first_name and last_name:
-                    full_name = f"{first_name} {last_name}".strip()
-                    employee = EmployeeCache(
-                        id=employee_id,
-                        user_id=data.get("user_id"),
-                        email=email,
-                        first_name=first_name,
-                        last_name=last_name,
-                        full_name=full_name,
-                        role=data.get("role", "employee"),
-                        job_title=data.get("job_title", "Unknown"),
-                        department=data.get("department"),
-                        team=data.get("team"),
-                        manager_id=data.get("manager_id"),
-                        employment_type=data.get("employment_type", "permanent"),
-                        status="active",
-                        joining_date=None,
-                        created_at=datetime.utcnow(),
-                        updated_at=datetime.utcnow(),
-                        synced_at=datetime.utcnow(),
-                    )
-                    session.add(employee)
-                    session.commit()
-                    logger.info(
-                        f"Created missing employee cache for {employee_id} from update event"
-                    )
-                return
-
-            # Update fields if present in the event
-            updated_fields = data.get("updated_fields", {})
-
-            # Update basic fields
-            if "email" in updated_fields:
-                employee.email = updated_fields["email"]
-            if "first_name" in updated_fields or "last_name" in updated_fields:
-                employee.first_name = updated_fields.get(
-                    "first_name", employee.first_name
-                )
-                employee.last_name = updated_fields.get("last_name", employee.last_name)
-                employee.full_name = (
-                    f"{employee.first_name} {employee.last_name}".strip()
-                )
-            if "role" in updated_fields:
-                employee.role = updated_fields["role"]
-            if "job_title" in updated_fields:
-                employee.job_title = updated_fields["job_title"]
-            if "department" in updated_fields:
-                employee.department = updated_fields["department"]
-            if "team" in updated_fields:
-                employee.team = updated_fields["team"]
-            if "manager_id" in updated_fields:
-                employee.manager_id = updated_fields["manager_id"]
-            if "employment_type" in updated_fields:
-                employee.employment_type = updated_fields["employment_type"]
-            if "status" in updated_fields:
-                employee.status = updated_fields["status"]
-            if "user_id" in updated_fields:
-                employee.user_id = updated_fields["user_id"]
-
-            employee.updated_at = datetime.utcnow()
-            employee.synced_at = datetime.utcnow()
-
-            session.add(employee)
+            changed = write(session, latest)
             session.commit()
-            logger.info(f"Successfully updated employee cache for {employee_id}")
+
+    except TRANSIENT_DB_ERRORS as e:
+        logger.warning(
+            "Database unavailable for employee.%s events, will retry: %s",
+            event_name,
+            e,
+        )
+        raise
 
     except Exception as e:
-        logger.error(f"Error handling employee.updated event: {e}", exc_info=True)
+        logger.error(
+            "Error handling employee.%s event: %s", event_name, e, exc_info=True
+        )
+        if len(latest) > 1:
+            for employee_events in sources.values():
+                _handle_batch(event_name, employee_events, write, merge)
+        return
 
+    for key in applied:
+        _recent_events[key] = True
+    for employee_id in changed:
+        employee_validation_service.invalidate(employee_id)
+    if changed:
+        logger.debug(
+            "Applied employee.%s to cache for employees %s", event_name, changed
+        )
 
-def handle_employee_deleted(event_data: dict[str, Any]):
-    """
-    Handle employee.deleted event from Employee Management Service.
 
-    Removes the employee from the cache or marks as deleted.
-    """
-    try:
-        data = event_data.get("data", {})
-        employee_id = data.get("employee_id")
+def _apply_each(apply: ApplyEvent) -> WriteBatch:
+    """Build a batch writer that reads all cached rows at once, then applies each."""
 
-        if not employee_id:
-            logger.error("Employee deleted event missing employee_id")
-            return
+    def write(session: Session, latest: dict[int, dict[str, Any]]) -> list[int]:
+        statement = select(EmployeeCache).where(EmployeeCache.id.in_(latest))
+        cached = {employee.id: employee for employee in session.exec(statement)}
+        return [
+            employee_id
+            for employee_id, data in latest.items()
+            if apply(session, employee_id, cached.get(employee_id), data)
+        ]
 
-        logger.info(f"Processing employee.deleted event for employee {employee_id}")
+    return write
 
-        with Session(engine) as session:
-            employee = session.get(EmployeeCache, employee_id)
 
-            if not employee:
-                logger.warning(
-                    f"Employee {employee_id} not found in cache, nothing to delete"
-                )
-                return
+def _upsert_created(session: Session, latest: dict[int, dict[str, Any]]) -> list[int]:
+    """
+    Write employee.created events with one multi-row upsert.
 
-            # Soft delete - mark as deleted instead of removing from database
-            # This preserves attendance history for deleted employees
-            employee.status = "deleted"
-            employee.updated_at = datetime.utcnow()
-            employee.synced_at = datetime.utcnow()
+    New employees are inserted and already cached ones overwritten, except
+    for their status: a replayed created event must not bring a terminated or
+    deleted employee back to active. Events whose email is already cached
+    under another employee are skipped, since the upsert would otherwise
+    overwrite that employee's row through the unique email key.
+    """
+    emails = {
+        employee_id: data.get("email", "") for employee_id, data in latest.items()
+    }
+    # MySQL's default collation compares emails case-insensitively
+    statement = select(EmployeeCache.id, EmployeeCache.email).where(
+        EmployeeCache.email.in_(set(emails.values()))
+    )
+    owners = {email.lower(): owner_id for owner_id, email in session.exec(statement)}
+
+    now = utcnow()
+    rows = []
+    for employee_id, data in latest.items():
+        email = emails[employee_id]
+        owner_id = owners.setdefault(email.lower(), employee_id)
+        if owner_id != employee_id:
+            logger.error(
+                "Skipping employee.created for %s: email %s belongs to employee %s",
+                employee_id,
+                email,
+                owner_id,
+            )
+            continue
 
-            session.add(employee)
-            session.commit()
-            logger.info(f"Marked employee {employee_id} as deleted in cache")
+        first_name = data.get("first_name", "")
+        last_name = data.get("last_name", "")
+        rows.append(
+            {
+                "id": employee_id,
+                "user_id": data.get("user_id"),
+                "email": email,
+                "first_name": first_name,
+                "last_name": last_name,
+                "full_name": f"{first_name} {last_name}".strip(),
+                "role": data.get("role", "employee"),
+                "job_title": data.get("job_title", ""),
+                "department": data.get("department"),
+                "team": data.get("team"),
+                "manager_id": data.get("manager_id"),
+                "employment_type": data.get("employment_type", "permanent"),
+                "status": "active",
+                "joining_date": _parse_date(data.get("joining_date")),
+                "created_at": now,
+                "updated_at": now,
+                "synced_at": now,
+            }
+        )
+
+    if not rows:
+        return []
+
+    statement = mysql_insert(EmployeeCache).values(rows)
+    # Existing rows keep their id, created_at and status; the rest is replaced
+    statement = statement.on_duplicate_key_update(
+        {
+            name: statement.inserted[name]
+            for name in rows[0]
+            if name not in ("id", "created_at", "status")
+        }
+    )
+    session.execute(statement)
+    return [row["id"] for row in rows]
+
+
+def _apply_updated(
+    session: Session,
+    employee_id: int,
+    employee: Optional[EmployeeCache],
+    data: dict[str, Any],
+) -> bool:
+    """Apply an employee.updated event's changed fields to the cache row."""
+    now = utcnow()
+
+    if not employee:
+        logger.warning(
+            "Employee %s not found in cache, cannot update. "
+            "Will try to fetch from employee service.",
+            employee_id,
+        )
+        # If employee doesn't exist, we might have missed the creation event
+        # Try to create it with the data we have
+        email = data.get("email", "")
+        first_name = data.get("first_name", "")
+        last_name = data.get("last_name", "")
 
-    except Exception as e:
-        logger.error(f"Error handling employee.deleted event: {e}", exc_info=True)
+        if not (email and first_name and last_name):
+            return False
+
+        session.add(
+            EmployeeCache(
+                id=employee_id,
+                user_id=data.get("user_id"),
+                email=email,
+                first_name=first_name,
+                last_name=last_name,
+                full_name=f"{first_name} {last_name}".strip(),
+                role=data.get("role", "employee"),
+                job_title=data.get("job_title", "Unknown"),
+                department=data.get("department"),
+                team=data.get("team"),
+                manager_id=data.get("manager_id"),
+                employment_type=data.get("employment_type", "permanent"),
+                status="active",
+                joining_date=None,
+                created_at=now,
+                updated_at=now,
+                synced_at=now,
+            )
+        )
+        logger.info(
+            "Creating missing employee cache for %s from update event", employee_id
+        )
+        return True
+
+    # Update fields if present in the event
+    updated_fields = data.get("updated_fields") or {}
+
+    # Update basic fields
+    if "email" in updated_fields:
+        employee.email = updated_fields["email"]
+    if "first_name" in updated_fields or "last_name" in updated_fields:
+        employee.first_name = updated_fields.get("first_name", employee.first_name)
+        employee.last_name = updated_fields.get("last_name", employee.last_name)
+        employee.full_name = f"{employee.first_name} {employee.last_name}".strip()
+    if "role" in updated_fields:
+        employee.role = updated_fields["role"]
+    if "job_title" in updated_fields:
+        employee.job_title = updated_fields["job_title"]
+    if "department" in updated_fields:
+        employee.department = updated_fields["department"]
+    if "team" in updated_fields:
+        employee.team = updated_fields["team"]
+    if "manager_id" in updated_fields:
+        employee.manager_id = updated_fields["manager_id"]
+    if "employment_type" in updated_fields:
+        employee.employment_type = updated_fields["employment_type"]
+    if "status" in updated_fields:
+        employee.status = updated_fields["status"]
+    if "user_id" in updated_fields:
+        employee.user_id = updated_fields["user_id"]
+
+    # The row is tracked by the session, so the commit flushes these changes
+    employee.updated_at = now
+    employee.synced_at = now
+    return True
+
+
+def _merge_updates(previous: dict[str, Any], data: dict[str, Any]) -> dict[str, Any]:
+    """Combine two employee.updated payloads, the later one's fields winning."""
+    return {
+        **data,
+        "updated_fields": {
+            **(previous.get("updated_fields") or {}),
+            **(data.get("updated_fields") or {}),
+        },
+    }
+
+
+def _set_status(status: str) -> WriteBatch:
+    """Build a batch writer that sets the status of cached employees in one UPDATE."""
+
+    def write(session: Session, latest: dict[int, dict[str, Any]]) -> list[int]:
+        now = utcnow()
+        # Rows already in the target status are left alone, so redelivered
+        # events do not rewrite them
+        result = session.execute(
+            update(EmployeeCache)
+            .where(EmployeeCache.id.in_(latest), EmployeeCache.status != status)
+            .values(status=status, updated_at=now, synced_at=now)
+        )
+        if result.rowcount < len(latest):
+            logger.info(
+                "%d of %d employees not found in cache or already %s",
+                len(latest) - result.rowcount,
+                len(latest),
+                status,
+            )
+        # Invalidating an employee that was not cached is harmless
+        return list(latest)
+
+    return write
+
+
+# Soft delete - mark as deleted instead of removing from database
+# This preserves attendance history for deleted employees
+_mark_deleted = _set_status("deleted")
+_mark_terminated = _set_status("terminated")
+_mark_suspended = _set_status("suspended")
+_mark_activated = _set_status("active")
+
+
+def handle_employee_created_batch(events: list[dict[str, Any]]):
+    """
+    Handle a batch of employee.created events from Employee Management Service.
 
+    Creates or updates the employee cache with the latest data per employee.
+    """
+    _handle_batch("created", events, _upsert_created)
 
-def handle_employee_terminated(event_data: dict[str, Any]):
+
+def handle_employee_updated_batch(events: list[dict[str, Any]]):
     """
-    Handle employee.terminated event from Employee Management Service.
+    Handle a batch of employee.updated events from Employee Management Service.
 
-    Marks the employee as terminated in the cache.
+    Changed fields of several events for one employee are merged in order.
     """
-    try:
-        data = event_data.get("data", {})
-        employee_id = data.get("employee_id")
+    _handle_batch(
+        "updated", events, _apply_each(_apply_updated), merge=_merge_updates
+    )
 
-        if not employee_id:
-            logger.error("Employee terminated event missing employee_id")
-            return
 
-        logger.info(f"Processing employee.terminated event for employee {employee_id}")
+def handle_employee_deleted_batch(events: list[dict[str, Any]]):
+    """Handle a batch of employee.deleted events from Employee Management Service."""
+    _handle_batch("deleted", events, _mark_deleted)
 
-        with Session(engine) as session:
-            employee = session.get(EmployeeCache, employee_id)
 
-            if not employee:
-                logger.warning(f"Employee {employee_id} not found in cache")
-                return
+def handle_employee_terminated_batch(events: list[dict[str, Any]]):
+    """Handle a batch of employee.terminated events from Employee Management Service."""
+    _handle_batch("terminated", events, _mark_terminated)
 
-            employee.status = "terminated"
-            employee.updated_at = datetime.utcnow()
-            employee.synced_at = datetime.utcnow()
 
-            session.add(employee)
-            session.commit()
-            logger.info(f"Marked employee {employee_id} as terminated in cache")
+def handle_employee_suspended_batch(events: list[dict[str, Any]]):
+    """Handle a batch of employee.suspended events from Employee Management Service."""
+    _handle_batch("suspended", events, _mark_suspended)
 
-    except Exception as e:
-        logger.error(f"Error handling employee.terminated event: {e}", exc_info=True)
 
+def handle_employee_activated_batch(events: list[dict[str, Any]]):
+    """Handle a batch of employee.activated events from Employee Management Service."""
+    _handle_batch("activated", events, _mark_activated)
 
-def handle_employee_suspended(event_data: dict[str, Any]):
-    """
-    Handle employee.suspended event from Employee Management Service.
 
-    Marks the employee as suspended in the cache.
+def handle_employee_created(event_data: dict[str, Any]):
     """
-    try:
-        data = event_data.get("data", {})
-        employee_id = data.get("employee_id")
+    Handle employee.created event from Employee Management Service.
 
-        if not employee_id:
-            logger.error("Employee suspended event missing employee_id")
-            return
+    Creates or updates the employee cache with the new employee data.
+    """
+    handle_employee_created_batch([event_data])
 
-        logger.info(f"Processing employee.suspended event for employee {employee_id}")
 
-        with Session(engine) as session:
-            employee = session.get(EmployeeCache, employee_id)
+def handle_employee_updated(event_data: dict[str, Any]):
+    """
+    Handle employee.updated event from Employee Management Service.
 
-            if not employee:
-                logger.warning(f"Employee {employee_id} not found in cache")
-                return
+    Updates the employee cache with the changed fields.
+    """
+    handle_employee_updated_batch([event_data])
 
-            employee.status = "suspended"
-            employee.updated_at = datetime.utcnow()
-            employee.synced_at = datetime.utcnow()
 
-            session.add(employee)
-            session.commit()
-            logger.info(f"Marked employee {employee_id} as suspended in cache")
+def handle_employee_deleted(event_data: dict[str, Any]):
+    """
+    Handle employee.deleted event from Employee Management Service.
 
-    except Exception as e:
-        logger.error(f"Error handling employee.suspended event: {e}", exc_info=True)
+    Removes the employee from the cache or marks as deleted.
+    """
+    handle_employee_deleted_batch([event_data])
 
 
-def handle_employee_activated(event_data: dict[str, Any]):
+def handle_employee_terminated(event_data: dict[str, Any]):
     """
-    Handle employee.activated event from Employee Management Service.
+    Handle employee.terminated event from Employee Management Service.
 
-    Marks the employee as active in the cache.
+    Marks the employee as terminated in the cache.
     """
-    try:
-        data = event_data.get("data", {})
-        employee_id = data.get("employee_id")
-
-        if not employee_id:
-            logger.error("Employee activated event missing employee_id")
-            return
+    handle_employee_terminated_batch([event_data])
 
-        logger.info(f"Processing employee.activated event for employee {employee_id}")
 
-        with Session(engine) as session:
-            employee = session.get(EmployeeCache, employee_id)
+def handle_employee_suspended(event_data: dict[str, Any]):
+    """
+    Handle employee.suspended event from Employee Management Service.
 
-            if not employee:
-                logger.warning(f"Employee {employee_id} not found in cache")
-                return
+    Marks the employee as suspended in the cache.
+    """
+    handle_employee_suspended_batch([event_data])
 
-            employee.status = "active"
-            employee.updated_at = datetime.utcnow()
-            employee.synced_at = datetime.utcnow()
 
-            session.add(employee)
-            session.commit()
-            logger.info(f"Marked employee {employee_id} as active in cache")
+def handle_employee_activated(event_data: dict[str, Any]):
+    """
+    Handle employee.activated event from Employee Management Service.
 
-    except Exception as e:
-        logger.error(f"Error handling employee.activated event: {e}", exc_info=True)
+    Marks the employee as active in the cache.
+    """
+    handle_employee_activated_batch([event_data])
 
 
 def _parse_date(date_value: Any) -> datetime | None:
@@ -369,19 +475,25 @@ def _parse_date(date_value: Any) -> datetime | None:
 
     if isinstance(date_value, str):
         try:
-            # Try ISO format
-            return datetime.fromisoformat(date_value.replace("Z", "+00:00"))
+            # Covers plain YYYY-MM-DD dates and a trailing "Z" since Python 3.11
+            return datetime.fromisoformat(date_value)
         except ValueError:
-            try:
-                # Try common date format
-                return datetime.strptime(date_value, "%Y-%m-%d")
-            except ValueError:
-                logger.warning(f"Could not parse date: {date_value}")
-                return None
+            logger.warning(f"Could not parse date: {date_value}")
+            return None
 
     return None
 
 
+# Batch handler per consumed topic; batches coalesce bursts of events per
+# employee into one write
+EMPLOYEE_BATCH_HANDLERS: dict[str, Callable[[list[dict[str, Any]]], None]] = {
+    EMPLOYEE_CREATED_TOPIC: handle_employee_created_batch,
+    EMPLOYEE_UPDATED_TOPIC: handle_employee_updated_batch,
+    EMPLOYEE_DELETED_TOPIC: handle_employee_deleted_batch,
+    EMPLOYEE_TERMINATED_TOPIC: handle_employee_terminated_batch,
+}
+
+
 def register_employee_handlers():
     """
     Register all employee event handlers with the Kafka consumer.
@@ -396,16 +508,11 @@ def register_employee_handlers():
     logger.info("Registering employee event handlers...")
 
     # Register handlers for employee lifecycle events
-    KafkaConsumer.register_handler(EMPLOYEE_CREATED_TOPIC, handle_employee_created)
-    KafkaConsumer.register_handler(EMPLOYEE_UPDATED_TOPIC, handle_employee_updated)
-    KafkaConsumer.register_handler(EMPLOYEE_DELETED_TOPIC, handle_employee_deleted)
-    KafkaConsumer.register_handler(
-        EMPLOYEE_TERMINATED_TOPIC, handle_employee_terminated
-    )
+    for topic, handler in EMPLOYEE_BATCH_HANDLERS.items():
+        KafkaConsumer.register_batch_handler(topic, handler)
 
     logger.info(
-        f"Registered handlers for topics: {EMPLOYEE_CREATED_TOPIC}, "
-        f"{EMPLOYEE_UPDATED_TOPIC}, {EMPLOYEE_DELETED_TOPIC}, {EMPLOYEE_TERMINATED_TOPIC}"
+        f"Registered handlers for topics: {', '.join(EMPLOYEE_BATCH_HANDLERS)}"
     )
 
     logger.info("Employee event handlers registered successfully")
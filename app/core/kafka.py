@@ -5,20 +5,36 @@ Provides a thread-safe Kafka producer for publishing events
 and a consumer for subscribing to topics from other services.
 """
 
-import json
+import asyncio
+import time
 from datetime import date, datetime
 from decimal import Decimal
+from itertools import groupby
 from threading import Lock, Thread
 from typing import Any, Callable, Optional
 
-from confluent_kafka import Consumer, KafkaException, Producer
+import orjson
+from confluent_kafka import Consumer, KafkaException, Producer, TopicPartition
 
 from app.core.config import settings
+from app.core.database import TRANSIENT_DB_ERRORS
 from app.core.events import EventEnvelope
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# How often the background task serves producer delivery callbacks
+PRODUCER_POLL_INTERVAL = 0.05
+
+# The consumer fetches up to this many messages per call, waiting at most the
+# timeout (seconds) for a batch to fill before dispatching what it has
+CONSUMER_BATCH_SIZE = 500
+CONSUMER_BATCH_TIMEOUT = 0.1
+
+# Pause (seconds) before consuming again after a handler hit a transient
+# database error, so the database is not hammered with the same messages
+CONSUMER_RETRY_BACKOFF = 1.0
+
 
 def json_serializer(obj: Any) -> Any:
     """Custom JSON serializer for complex types."""
@@ -47,6 +63,7 @@ class KafkaProducer:
     _instance: Optional[Producer] = None
     _lock: Lock = Lock()
     _started: bool = False
+    _poll_task: Optional[asyncio.Task] = None
 
     @classmethod
     def get_producer(cls) -> Optional[Producer]:
@@ -61,6 +78,12 @@ class KafkaProducer:
                         "retries": 3,
                         "retry.backoff.ms": 1000,
                         "enable.idempotence": True,
+                        # Let librdkafka coalesce bursts (e.g. shift start)
+                        # into batches rather than sending one request each
+                        "linger.ms": settings.KAFKA_PRODUCER_LINGER_MS,
+                        "batch.size": settings.KAFKA_PRODUCER_BATCH_SIZE,
+                        "queue.buffering.max.messages": 100000,
+                        "compression.type": settings.KAFKA_PRODUCER_COMPRESSION,
                     }
                     cls._instance = Producer(config)
         return cls._instance
@@ -76,13 +99,24 @@ class KafkaProducer:
             producer = cls.get_producer()
             if producer:
                 cls._started = True
+                cls._poll_task = asyncio.create_task(cls._poll_loop())
                 logger.info(
                     f"Kafka producer initialized: {settings.KAFKA_BOOTSTRAP_SERVERS}"
                 )
 
+    @classmethod
+    async def _poll_loop(cls):
+        """Serve delivery callbacks so publishers never have to flush."""
+        while cls._started:
+            cls.poll(0)
+            await asyncio.sleep(PRODUCER_POLL_INTERVAL)
+
     @classmethod
     async def stop(cls):
         """Flush and close the Kafka producer."""
+        if cls._poll_task:
+            cls._poll_task.cancel()
+            cls._poll_task = None
         if cls._started and cls._instance:
             with cls._lock:
                 if cls._instance:
@@ -116,6 +150,7 @@ class KafkaConsumer:
     _running: bool = False
     _lock: Lock = Lock()
     _handlers: dict[str, list[Callable]] = {}
+    _batch_handlers: dict[str, list[Callable]] = {}
 
     @classmethod
     def get_consumer(cls) -> Optional[Consumer]:
@@ -128,8 +163,13 @@ class KafkaConsumer:
                         "group.id": "attendance-management-service-group",
                         "client.id": "attendance-management-service-consumer",
                         "auto.offset.reset": "earliest",
-                        "enable.auto.commit": True,
-                        "auto.commit.interval.ms": 5000,
+                        # Offsets are committed up to the last handled message
+                        "enable.auto.commit": False,
+                        # Let the broker gather larger fetches; employee sync
+                        # tolerates the added wait
+                        "fetch.min.bytes": 1_048_576,
+                        "fetch.wait.max.ms": 100,
+                        "max.partition.fetch.bytes": 5_242_880,
                     }
                     cls._instance = Consumer(config)
         return cls._instance
@@ -148,6 +188,65 @@ class KafkaConsumer:
         cls._handlers[topic].append(handler)
         logger.info(f"Registered handler for topic: {topic}")
 
+    @classmethod
+    def register_batch_handler(cls, topic: str, handler: Callable):
+        """
+        Register a handler that receives a topic's messages in batches.
+
+        The handler is called with the decoded messages of each run of
+        consecutive messages from the topic, in the order they were consumed.
+
+        Args:
+            topic: Kafka topic name
+            handler: Sync function taking a list of decoded messages
+        """
+        if topic not in cls._batch_handlers:
+            cls._batch_handlers[topic] = []
+        cls._batch_handlers[topic].append(handler)
+        logger.info(f"Registered batch handler for topic: {topic}")
+
+    @classmethod
+    def _decode(cls, msg) -> Optional[dict]:
+        """Decode a consumed message, or return None if it cannot be used."""
+        if msg.error():
+            logger.error(f"Consumer error: {msg.error()}")
+            return None
+
+        value = msg.value()
+        if not value:
+            return None
+
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to decode message: {e}")
+            return None
+
+    @classmethod
+    def _dispatch(cls, topic: str, messages: list[dict]):
+        """
+        Hand decoded messages from one topic to its handlers.
+
+        Handler errors are not caught here, so the consume loop can decide
+        whether to consume the messages again or skip them.
+        """
+        for data in messages:
+            for handler in cls._handlers.get(topic, []):
+                handler(data)
+
+        for handler in cls._batch_handlers.get(topic, []):
+            handler(messages)
+
+    @staticmethod
+    def _rewind(consumer: Consumer, messages: list) -> None:
+        """Seek each partition back to the first of the given messages on it."""
+        first: dict[tuple[str, int], int] = {}
+        for msg in messages:
+            if not msg.error():
+                first.setdefault((msg.topic(), msg.partition()), msg.offset())
+        for (topic, partition), offset in first.items():
+            consumer.seek(TopicPartition(topic, partition, offset))
+
     @classmethod
     def _consume_loop(cls):
         """Background thread that consumes messages."""
@@ -156,7 +255,7 @@ class KafkaConsumer:
             logger.error("Failed to create consumer")
             return
 
-        topics = list(cls._handlers.keys())
+        topics = list(cls._handlers.keys() | cls._batch_handlers.keys())
         if not topics:
             logger.warning("No topics to subscribe to")
             return
@@ -166,30 +265,58 @@ class KafkaConsumer:
 
         while cls._running:
             try:
-                msg = consumer.poll(timeout=1.0)
-
-                if msg is None:
-                    continue
-
-                if msg.error():
-                    logger.error(f"Consumer error: {msg.error()}")
-                    continue
-
-                topic = msg.topic()
-                value = msg.value()
-
-                if value:
-                    try:
-                        data = json.loads(value.decode("utf-8"))
-                        handlers = cls._handlers.get(topic, [])
+                batch = consumer.consume(
+                    num_messages=CONSUMER_BATCH_SIZE, timeout=CONSUMER_BATCH_TIMEOUT
+                )
 
-                        for handler in handlers:
-                            try:
-                                handler(data)
-                            except Exception as e:
-                                logger.error(f"Handler error for topic {topic}: {e}")
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode message: {e}")
+                # Next offset to commit per partition, advanced past each
+                # run of messages once its handlers have returned
+                handled: dict[tuple[str, int], int] = {}
+                failed = False
+
+                # Dispatch runs of consecutive messages per topic, so events
+                # are still handled in the order they were consumed
+                position = 0
+                for topic, run in groupby(batch, key=lambda msg: msg.topic()):
+                    run = list(run)
+                    messages = [
+                        data for data in map(cls._decode, run) if data is not None
+                    ]
+                    if messages:
+                        try:
+                            cls._dispatch(topic, messages)
+                        except TRANSIENT_DB_ERRORS as e:
+                            # The database is unavailable, so stop here and
+                            # consume this run and everything after it again
+                            logger.error(
+                                f"Handler error for topic {topic}, retrying: {e}"
+                            )
+                            cls._rewind(consumer, batch[position:])
+                            failed = True
+                            break
+                        except Exception as e:
+                            # Anything else fails the same way on every retry,
+                            # so log it and commit past the messages
+                            logger.error(
+                                f"Handler error for topic {topic}, skipping "
+                                f"{len(messages)} messages: {e}",
+                                exc_info=True,
+                            )
+                    for msg in run:
+                        if not msg.error():
+                            handled[(msg.topic(), msg.partition())] = msg.offset() + 1
+                    position += len(run)
+
+                if handled:
+                    consumer.commit(
+                        offsets=[
+                            TopicPartition(topic, partition, offset)
+                            for (topic, partition), offset in handled.items()
+                        ],
+                        asynchronous=True,
+                    )
+                if failed:
+                    time.sleep(CONSUMER_RETRY_BACKOFF)
 
             except Exception as e:
                 logger.error(f"Consumer loop error: {e}")
@@ -208,7 +335,7 @@ class KafkaConsumer:
             logger.warning("Consumer already running")
             return
 
-        if not cls._handlers:
+        if not cls._handlers and not cls._batch_handlers:
             logger.info("No handlers registered, skipping consumer start")
             return
 
@@ -252,7 +379,7 @@ async def publish_event(topic: str, event: EventEnvelope) -> bool:
             return False
 
         event_dict = event.model_dump()
-        message = json.dumps(event_dict, default=json_serializer).encode("utf-8")
+        message = orjson.dumps(event_dict, default=json_serializer)
 
         producer.produce(
             topic=topic,
@@ -269,6 +396,12 @@ async def publish_event(topic: str, event: EventEnvelope) -> bool:
         )
         return True
 
+    except BufferError:
+        logger.error(
+            f"Kafka producer queue full, dropping event {event.event_type} "
+            f"(event_id: {event.event_id})"
+        )
+        return False
     except KafkaException as e:
         logger.error(f"Kafka error publishing event: {e}")
         return False
@@ -302,7 +435,7 @@ async def publish_event_sync(
             return False
 
         event_dict = event.model_dump()
-        message = json.dumps(event_dict, default=json_serializer).encode("utf-8")
+        message = orjson.dumps(event_dict, default=json_serializer)
 
         delivery_result = {"delivered": False, "error": None}
 
@@ -196,6 +196,9 @@ async def get_current_user(
         def protected_route(user: Annotated[TokenData, Depends(get_current_user)]):
             return {"username": user.username}
 
+    FastAPI caches dependency results per request, so the token is decoded
+    once even when several dependencies of a route need the user.
+
     Args:
         credentials: HTTP Authorization credentials (Bearer token)
 
@@ -0,0 +1,15 @@
+"""
+Time helpers shared by the models and the event handlers.
+"""
+
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """
+    Current UTC time as a naive datetime.
+
+    Matches the naive UTC values stored in the DATETIME timestamp columns,
+    without the deprecated datetime.utcnow().
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
@@ -13,11 +13,14 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from prometheus_client import make_asgi_app
 
+from app.api.clients.employee_service import get_employee_service
 from app.api.routes.attendance import router as attendance_router
 from app.core.cache import RedisClient
 from app.core.config import settings
-from app.core.database import create_db_and_tables
+from app.core.database import async_engine, create_db_and_tables
 from app.core.handlers import register_employee_handlers
 from app.core.kafka import KafkaConsumer, KafkaProducer
 from app.core.logging import get_logger
@@ -49,6 +52,12 @@ async def lifespan(_: FastAPI):
     except Exception as e:
         logger.warning(f"Failed to initialize Redis: {e}")
 
+    # Create the pooled employee service client up front, inside the running
+    # event loop, so the first request does not pay for building it
+    logger.info("Initializing employee service HTTP client...")
+    get_employee_service()
+    logger.info("Employee service HTTP client initialized")
+
     logger.info("Initializing Kafka producer...")
     await KafkaProducer.start()
     logger.info("Kafka producer initialized")
@@ -82,6 +91,15 @@ async def lifespan(_: FastAPI):
     RedisClient.close()
     logger.info("Redis client closed")
 
+    logger.info("Closing employee service HTTP client...")
+    await get_employee_service().aclose()
+    get_employee_service.cache_clear()
+    logger.info("Employee service HTTP client closed")
+
+    logger.info("Disposing async database engine...")
+    await async_engine.dispose()
+    logger.info("Async database engine disposed")
+
     logger.info("Attendance Management Service shutdown complete")
 
 
@@ -91,6 +109,7 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="Attendance Management Service for HRMS - Tracks employee check-in/out, overtime, and attendance metrics",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -109,6 +128,9 @@ app.add_middleware(
 # Include routers
 app.include_router(attendance_router, prefix="/api/v1")
 
+# Prometheus metrics (employee service client timings, etc.)
+app.mount("/metrics", make_asgi_app())
+
 
 # Health check endpoint
 @app.get("/health", tags=["health"])
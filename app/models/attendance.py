@@ -17,8 +17,11 @@ from typing import Optional
 
 from pydantic import BaseModel
 from pydantic import Field as PydanticField
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
+from app.core.timeutils import utcnow
+
 
 class AttendanceStatus(str, Enum):
     """Status of attendance record."""
@@ -55,16 +58,25 @@ class Attendance(SQLModel, table=True):
     """
 
     __tablename__ = "attendance"
+    __table_args__ = (
+        # One record per employee per day; also serves every
+        # employee_id + date lookup as an index seek
+        Index("ix_attendance_emp_date", "employee_id", "date", unique=True),
+        # Per-day status counts for the dashboard
+        Index("ix_attendance_date_status", "date", "status"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
 
     # Employee reference
-    employee_id: int = Field(index=True, nullable=False)
+    # Indexed as the leading column of ix_attendance_emp_date
+    employee_id: int = Field(nullable=False)
     user_id: Optional[int] = Field(default=None, index=True)
     email: Optional[str] = Field(default=None, max_length=255)
 
     # Date and times
-    date: str = Field(index=True, nullable=False, max_length=10)  # YYYY-MM-DD format
+    # YYYY-MM-DD format; indexed as the leading column of ix_attendance_date_status
+    date: str = Field(nullable=False, max_length=10)
     check_in_time: Optional[datetime] = Field(default=None, nullable=True)
     check_out_time: Optional[datetime] = Field(default=None, nullable=True)
 
@@ -120,8 +132,13 @@ class Attendance(SQLModel, table=True):
     approved_at: Optional[datetime] = Field(default=None)
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    created_at: datetime = Field(default_factory=utcnow, nullable=False)
+    # Naive UTC like created_at; also stamped on every UPDATE statement
+    updated_at: datetime = Field(
+        default_factory=utcnow,
+        nullable=False,
+        sa_column_kwargs={"onupdate": utcnow},
+    )
 
 
 # Request Schemas
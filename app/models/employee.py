@@ -11,6 +11,8 @@ from typing import Optional
 
 from sqlmodel import Field, SQLModel
 
+from app.core.timeutils import utcnow
+
 
 class EmployeeCache(SQLModel, table=True):
     """
@@ -57,13 +59,13 @@ class EmployeeCache(SQLModel, table=True):
 
     # Timestamps
     created_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Cache record created at"
+        default_factory=utcnow, description="Cache record created at"
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Cache record updated at"
+        default_factory=utcnow, description="Cache record updated at"
     )
     synced_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Last synced from Kafka event"
+        default_factory=utcnow, description="Last synced from Kafka event"
     )
 
     class Config:
@@ -0,0 +1,285 @@
+"""
+Integration tests for the attendance routes.
+
+Tests the SQL-aggregated monthly summary and its Redis cache, the check-in
+upsert and the streamed manager dashboard against the database.
+"""
+
+import calendar
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncResult, create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import app.api.routes.attendance as attendance_routes
+from app.core.cache import RedisClient, get_monthly_summary_key
+from app.core.config import settings
+from app.core.database import engine, get_session
+from app.core.employee_service import employee_validation_service
+from app.core.security import TokenData, get_current_active_user
+from app.main import app
+from app.models.attendance import Attendance
+from app.models.employee import EmployeeCache
+
+
+class FakeRedis(dict):
+    """In-memory stand-in for the few Redis commands the summary cache uses."""
+
+    def setex(self, key, ttl, value):
+        self[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.pop(key, None)
+
+
+@pytest.fixture
+def db_session():
+    """Create a database session for testing."""
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def clean_attendance(db_session):
+    """Clean attendance records and seed one active employee."""
+    # Clean before
+    db_session.execute(delete(Attendance))
+    db_session.execute(delete(EmployeeCache))
+    db_session.add(
+        EmployeeCache(
+            id=1,
+            email="john.doe@company.com",
+            first_name="John",
+            last_name="Doe",
+            full_name="John Doe",
+            role="employee",
+            job_title="Engineer",
+            employment_type="permanent",
+            status="active",
+        )
+    )
+    db_session.commit()
+    employee_validation_service.clear_lookup_cache()
+
+    yield
+
+    # Clean after
+    db_session.execute(delete(Attendance))
+    db_session.execute(delete(EmployeeCache))
+    db_session.commit()
+    employee_validation_service.clear_lookup_cache()
+
+
+@pytest.fixture
+def redis_cache(monkeypatch):
+    """Replace the Redis client with an in-memory one."""
+    fake = FakeRedis()
+    monkeypatch.setattr(RedisClient, "get_client", classmethod(lambda cls: fake))
+    return fake
+
+
+@pytest.fixture
+def client(monkeypatch, redis_cache):
+    """Test client signed in as an HR manager, with event publishing stubbed."""
+
+    async def publish_event(topic, event):
+        return True
+
+    monkeypatch.setattr(attendance_routes, "publish_event", publish_event)
+
+    # Each TestClient request runs on its own event loop, so pooled async
+    # connections must not be reused across requests
+    test_engine = create_async_engine(settings.async_database_url, poolclass=NullPool)
+
+    async def session_override():
+        async with AsyncSession(test_engine, expire_on_commit=False) as session:
+            yield session
+
+    user = TokenData(
+        sub="u1", email="hr@company.com", roles=["HR-Managers"], groups=["HR-Managers"]
+    )
+    app.dependency_overrides[get_session] = session_override
+    app.dependency_overrides[get_current_active_user] = lambda: user
+
+    yield TestClient(app, raise_server_exceptions=False)
+
+    app.dependency_overrides.clear()
+
+
+def test_monthly_summary_matches_per_record_computation(
+    clean_attendance, db_session, client
+):
+    """Test that the SQL aggregation agrees with summing the records in Python."""
+    # Arrange - A mix of statuses, open check-ins and a record outside the month
+    def record(day, status, hours=None, overtime="0", short_leave="0"):
+        check_in = datetime(2024, 3, day, 9, 0, 0)
+        return Attendance(
+            employee_id=1,
+            date=f"2024-03-{day:02d}",
+            check_in_time=check_in if status != "absent" else None,
+            check_out_time=check_in + timedelta(hours=hours) if hours else None,
+            status=status,
+            overtime_hours=Decimal(overtime),
+            short_leave_hours=Decimal(short_leave),
+        )
+
+    records = [
+        record(1, "present", hours=8),
+        record(4, "present", hours=9.5, overtime="1.50"),
+        record(5, "late", hours=7.25, short_leave="0.75"),
+        record(6, "absent"),
+        record(7, "on_leave"),
+        record(8, "present"),  # Checked in, never checked out
+    ]
+    for attendance in records:
+        db_session.add(attendance)
+    db_session.add(
+        Attendance(
+            employee_id=1,
+            date="2024-04-01",
+            check_in_time=datetime(2024, 4, 1, 9),
+            check_out_time=datetime(2024, 4, 1, 17),
+            status="present",
+        )
+    )
+    db_session.commit()
+
+    # Act
+    response = client.get("/api/v1/attendance/summary/1/2024-03")
+
+    # Assert - Same figures as computing them record by record
+    assert response.status_code == 200
+    summary = response.json()
+    worked = [
+        (r.check_out_time - r.check_in_time).total_seconds() / 3600
+        for r in records
+        if r.check_in_time and r.check_out_time
+    ]
+    working_days = sum(
+        1 for week in calendar.monthcalendar(2024, 3) for day in week[:5] if day
+    )
+    present = sum(1 for r in records if r.status == "present")
+    late = sum(1 for r in records if r.status == "late")
+    assert summary["days_present"] == present
+    assert summary["days_late"] == late
+    assert summary["days_absent"] == sum(1 for r in records if r.status == "absent")
+    assert summary["days_on_leave"] == sum(
+        1 for r in records if r.status == "on_leave"
+    )
+    assert summary["total_working_days"] == working_days
+    assert summary["total_hours_worked"] == round(sum(worked), 2)
+    assert summary["average_daily_hours"] == round(sum(worked) / len(worked), 2)
+    assert summary["total_overtime_hours"] == 1.5
+    assert summary["total_short_leave_hours"] == 0.75
+    assert summary["attendance_rate"] == round(
+        (present + late) / working_days * 100, 2
+    )
+    assert len(summary["records"]) == len(records)
+
+
+def test_monthly_summary_cache_invalidated_on_check_in_and_out(
+    clean_attendance, client, redis_cache
+):
+    """Test that check-in and check-out drop the cached monthly summary."""
+    # Arrange - Cache the current month's summary
+    month = datetime.now().strftime("%Y-%m")
+    key = get_monthly_summary_key(1, month, True)
+    summary_url = f"/api/v1/attendance/summary/1/{month}"
+    assert client.get(summary_url).json()["days_present"] == 0
+    assert key in redis_cache
+
+    # Act / Assert - Check-in invalidates the summary
+    response = client.post("/api/v1/attendance/check-in", json={"employee_id": 1})
+    assert response.status_code == 201
+    assert key not in redis_cache
+    assert client.get(summary_url).json()["days_present"] == 1
+    assert key in redis_cache
+
+    # Act / Assert - Check-out invalidates it again
+    response = client.post("/api/v1/attendance/check-out", json={"employee_id": 1})
+    assert response.status_code == 200
+    assert key not in redis_cache
+
+
+def test_repeated_check_in_updates_one_record(clean_attendance, db_session, client):
+    """Test that checking in twice on one day keeps a single attendance record."""
+    # Act
+    first = client.post("/api/v1/attendance/check-in", json={"employee_id": 1})
+    second = client.post("/api/v1/attendance/check-in", json={"employee_id": 1})
+
+    # Assert
+    assert first.status_code == 201
+    assert second.status_code == 201
+    assert second.json()["id"] == first.json()["id"]
+    assert second.json()["check_in_time"] >= first.json()["check_in_time"]
+    records = db_session.exec(
+        select(Attendance).where(Attendance.date == date.today().isoformat())
+    ).all()
+    assert len(records) == 1
+
+
+def test_dashboard_streams_all_records(
+    clean_attendance, db_session, client, monkeypatch
+):
+    """Test that the dashboard streams every record across several chunks."""
+    # Arrange - Five records, fetched two at a time
+    monkeypatch.setattr(attendance_routes, "DASHBOARD_YIELD_PER", 2)
+    for employee_id in range(1, 6):
+        db_session.add(
+            Attendance(
+                employee_id=employee_id,
+                date="2024-03-01",
+                check_in_time=datetime(2024, 3, 1, 9),
+                status="late" if employee_id == 5 else "present",
+            )
+        )
+    db_session.commit()
+
+    # Act
+    response = client.get("/api/v1/attendance/dashboard/summary?date=2024-03-01")
+
+    # Assert
+    assert response.status_code == 200
+    dashboard = orjson.loads(response.content)
+    assert dashboard["checked_in"] == 5
+    assert dashboard["present"] == 4
+    assert dashboard["late"] == 1
+    assert sorted(r["employee_id"] for r in dashboard["records"]) == [1, 2, 3, 4, 5]
+
+
+def test_dashboard_query_failure_returns_error_status(
+    clean_attendance, client, monkeypatch
+):
+    """Test that a failing records query is not sent as a 200 with partial JSON."""
+
+    # Arrange
+    async def fetchmany(self, size=None):
+        raise RuntimeError("database went away")
+
+    monkeypatch.setattr(AsyncResult, "fetchmany", fetchmany)
+
+    # Act
+    response = client.get("/api/v1/attendance/dashboard/summary?date=2024-03-01")
+
+    # Assert
+    assert response.status_code == 500
+
+
+def test_dashboard_rejects_invalid_date_like_other_endpoints(clean_attendance, client):
+    """Test that a malformed dashboard date gets the same 422 as history."""
+    # Act
+    dashboard = client.get("/api/v1/attendance/dashboard/summary?date=2024-13-01")
+    history = client.get("/api/v1/attendance/employee/1?start_date=2024-13-01")
+
+    # Assert
+    assert dashboard.status_code == 422
+    assert history.status_code == 422
+    assert dashboard.json()["detail"][0]["loc"] == ["query", "date"]
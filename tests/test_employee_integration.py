@@ -6,17 +6,21 @@ the validation service's cache-first approach.
 """
 
 from datetime import datetime
+from uuid import uuid4
 
 import pytest
+from sqlalchemy import delete
 from sqlmodel import Session, select
 
 from app.core.database import engine
 from app.core.employee_service import employee_validation_service
 from app.core.handlers.employee_handlers import (
     handle_employee_created,
+    handle_employee_created_batch,
     handle_employee_deleted,
     handle_employee_terminated,
     handle_employee_updated,
+    handle_employee_updated_batch,
 )
 from app.models.employee import EmployeeCache
 
@@ -32,17 +36,16 @@ def db_session():
 def clean_employee_cache(db_session):
     """Clean employee cache before and after tests."""
     # Clean before
-    db_session.exec(select(EmployeeCache)).all()
-    for employee in db_session.exec(select(EmployeeCache)).all():
-        db_session.delete(employee)
+    db_session.execute(delete(EmployeeCache))
     db_session.commit()
+    employee_validation_service.clear_lookup_cache()
 
     yield
 
     # Clean after
-    for employee in db_session.exec(select(EmployeeCache)).all():
-        db_session.delete(employee)
+    db_session.execute(delete(EmployeeCache))
     db_session.commit()
+    employee_validation_service.clear_lookup_cache()
 
 
 def test_handle_employee_created(clean_employee_cache, db_session):
@@ -300,6 +303,43 @@ async def test_get_employee_by_email(clean_employee_cache, db_session):
     assert employee_data["email"] == "john.doe@company.com"
 
 
+@pytest.mark.asyncio
+async def test_get_employee_by_email_fresh_skips_lookup_cache(
+    clean_employee_cache, db_session
+):
+    """Test that fresh=True sees a change another replica's consumer wrote."""
+    # Arrange - Remember the employee, then change the shared table directly
+    employee = EmployeeCache(
+        id=1,
+        email="john.doe@company.com",
+        first_name="John",
+        last_name="Doe",
+        full_name="John Doe",
+        role="employee",
+        job_title="Engineer",
+        employment_type="permanent",
+        status="active",
+    )
+    db_session.add(employee)
+    db_session.commit()
+    await employee_validation_service.get_employee_by_email("john.doe@company.com")
+    employee.status = "terminated"
+    db_session.add(employee)
+    db_session.commit()
+
+    # Act
+    cached = await employee_validation_service.get_employee_by_email(
+        "john.doe@company.com"
+    )
+    fresh = await employee_validation_service.get_employee_by_email(
+        "john.doe@company.com", fresh=True
+    )
+
+    # Assert
+    assert cached["status"] == "active"
+    assert fresh["status"] == "terminated"
+
+
 def test_get_cached_employee_count(clean_employee_cache, db_session):
     """Test getting cached employee count."""
     # Arrange - Add multiple employees
@@ -400,3 +440,366 @@ def test_employee_created_event_idempotency(clean_employee_cache, db_session):
     employees = db_session.exec(select(EmployeeCache)).all()
     assert len(employees) == 1
     assert employees[0].id == 1
+
+
+def test_employee_created_batch_keeps_latest_event(clean_employee_cache, db_session):
+    """Test that several created events for one employee resolve to the last one."""
+    # Arrange
+    events = [
+        {
+            "event_type": "employee.created",
+            "data": {
+                "employee_id": 1,
+                "email": "john.doe@company.com",
+                "first_name": "John",
+                "last_name": "Doe",
+                "job_title": title,
+            },
+        }
+        for title in ("Junior Engineer", "Engineer", "Senior Engineer")
+    ]
+
+    # Act
+    handle_employee_created_batch(events)
+
+    # Assert
+    employees = db_session.exec(select(EmployeeCache)).all()
+    assert len(employees) == 1
+    assert employees[0].job_title == "Senior Engineer"
+
+
+def test_employee_updated_batch_merges_fields(clean_employee_cache, db_session):
+    """Test that updated events for one employee in a batch are merged in order."""
+    # Arrange
+    employee = EmployeeCache(
+        id=1,
+        email="john.doe@company.com",
+        first_name="John",
+        last_name="Doe",
+        full_name="John Doe",
+        role="employee",
+        job_title="Junior Engineer",
+        employment_type="permanent",
+        status="active",
+    )
+    db_session.add(employee)
+    db_session.commit()
+
+    # Act
+    handle_employee_updated_batch(
+        [
+            {
+                "event_type": "employee.updated",
+                "data": {
+                    "employee_id": 1,
+                    "updated_fields": {
+                        "job_title": "Engineer",
+                        "department": "Engineering",
+                    },
+                },
+            },
+            {
+                "event_type": "employee.updated",
+                "data": {
+                    "employee_id": 1,
+                    "updated_fields": {"job_title": "Senior Engineer"},
+                },
+            },
+        ]
+    )
+
+    # Assert
+    db_session.refresh(employee)
+    assert employee.job_title == "Senior Engineer"
+    assert employee.department == "Engineering"
+
+
+def test_employee_updated_batch_survives_bad_event(clean_employee_cache, db_session):
+    """Test that one failing event does not drop the rest of its batch."""
+    # Arrange
+    for i in range(1, 4):
+        db_session.add(
+            EmployeeCache(
+                id=i,
+                email=f"employee{i}@company.com",
+                first_name="Employee",
+                last_name=f"{i}",
+                full_name=f"Employee {i}",
+                role="employee",
+                job_title="Engineer",
+                employment_type="permanent",
+                status="active",
+            )
+        )
+    db_session.commit()
+
+    # Act - Employee 2 takes employee 3's email, which violates the unique key
+    handle_employee_updated_batch(
+        [
+            {
+                "event_type": "employee.updated",
+                "data": {
+                    "employee_id": 1,
+                    "updated_fields": {"job_title": "Senior Engineer"},
+                },
+            },
+            {
+                "event_type": "employee.updated",
+                "data": {
+                    "employee_id": 2,
+                    "updated_fields": {"email": "employee3@company.com"},
+                },
+            },
+            {
+                "event_type": "employee.updated",
+                "data": {
+                    "employee_id": 3,
+                    "updated_fields": {"department": "Architecture"},
+                },
+            },
+        ]
+    )
+
+    # Assert
+    db_session.expire_all()
+    assert db_session.get(EmployeeCache, 1).job_title == "Senior Engineer"
+    assert db_session.get(EmployeeCache, 2).email == "employee2@company.com"
+    assert db_session.get(EmployeeCache, 3).department == "Architecture"
+
+
+@pytest.mark.asyncio
+async def test_employee_events_invalidate_lookup_cache(
+    clean_employee_cache, db_session
+):
+    """Test that handled events drop the in-process lookup cache entry."""
+    # Arrange - Cache the employee's lookup
+    db_session.add(
+        EmployeeCache(
+            id=1,
+            email="john.doe@company.com",
+            first_name="John",
+            last_name="Doe",
+            full_name="John Doe",
+            role="employee",
+            job_title="Engineer",
+            employment_type="permanent",
+            status="active",
+        )
+    )
+    db_session.commit()
+    employee_data = await employee_validation_service.get_employee(1)
+    assert employee_data["job_title"] == "Engineer"
+
+    # Act
+    handle_employee_updated(
+        {
+            "event_type": "employee.updated",
+            "data": {
+                "employee_id": 1,
+                "updated_fields": {"job_title": "Senior Engineer"},
+            },
+        }
+    )
+    handle_employee_terminated(
+        {"event_type": "employee.terminated", "data": {"employee_id": 1}}
+    )
+
+    # Assert
+    employee_data = await employee_validation_service.get_employee(1)
+    assert employee_data["job_title"] == "Senior Engineer"
+    assert employee_data["status"] == "terminated"
+
+
+def test_repeated_event_id_is_skipped(clean_employee_cache, db_session):
+    """Test that a redelivered event (same event_id) is not applied again."""
+    # Arrange
+    event_data = {
+        "event_id": str(uuid4()),
+        "event_type": "employee.created",
+        "data": {
+            "employee_id": 1,
+            "email": "john.doe@company.com",
+            "first_name": "John",
+            "last_name": "Doe",
+            "job_title": "Engineer",
+        },
+    }
+    handle_employee_created(event_data)
+    employee = db_session.get(EmployeeCache, 1)
+    employee.job_title = "Changed since"
+    db_session.add(employee)
+    db_session.commit()
+
+    # Act - Kafka redelivers the same event
+    handle_employee_created(event_data)
+
+    # Assert
+    db_session.refresh(employee)
+    assert employee.job_title == "Changed since"
+
+
+def test_replayed_created_event_keeps_terminated_status(
+    clean_employee_cache, db_session
+):
+    """Test that replaying an old created event does not reactivate an employee."""
+    # Arrange
+    created_event = {
+        "event_type": "employee.created",
+        "data": {
+            "employee_id": 1,
+            "email": "john.doe@company.com",
+            "first_name": "John",
+            "last_name": "Doe",
+            "job_title": "Engineer",
+        },
+    }
+    handle_employee_created(dict(created_event, event_id=str(uuid4())))
+    handle_employee_terminated(
+        {
+            "event_id": str(uuid4()),
+            "event_type": "employee.terminated",
+            "data": {"employee_id": 1},
+        }
+    )
+
+    # Act - The created event comes back, e.g. after an offset reset
+    handle_employee_created(dict(created_event, event_id=str(uuid4())))
+
+    # Assert
+    employee = db_session.get(EmployeeCache, 1)
+    assert employee.status == "terminated"
+    assert employee_validation_service.verify_employee_exists(1) is False
+
+
+def test_malformed_events_are_skipped(clean_employee_cache, db_session):
+    """Test that events with the wrong shape are dropped without raising."""
+    # Arrange
+    employee = EmployeeCache(
+        id=1,
+        email="john.doe@company.com",
+        first_name="John",
+        last_name="Doe",
+        full_name="John Doe",
+        role="employee",
+        job_title="Engineer",
+        employment_type="permanent",
+        status="active",
+    )
+    db_session.add(employee)
+    db_session.commit()
+
+    # Act
+    handle_employee_created_batch([{"data": None}, ["not", "an", "object"]])
+    handle_employee_updated_batch(
+        [
+            {"event_type": "employee.updated", "data": None},
+            "not an object",
+            {"event_type": "employee.updated", "data": {"employee_id": [1]}},
+            {
+                "event_type": "employee.updated",
+                "data": {"employee_id": 1, "updated_fields": None},
+            },
+            {
+                "event_type": "employee.updated",
+                "data": {
+                    "employee_id": 1,
+                    "updated_fields": {"job_title": "Senior Engineer"},
+                },
+            },
+        ]
+    )
+
+    # Assert - The well-formed event still applied
+    db_session.refresh(employee)
+    assert employee.job_title == "Senior Engineer"
+
+
+def test_repeated_event_id_within_batch_is_skipped(clean_employee_cache, db_session):
+    """Test that an event delivered twice in one batch is applied once."""
+    # Arrange
+    employee = EmployeeCache(
+        id=1,
+        email="john.doe@company.com",
+        first_name="John",
+        last_name="Doe",
+        full_name="John Doe",
+        role="employee",
+        job_title="Engineer",
+        employment_type="permanent",
+        status="active",
+    )
+    db_session.add(employee)
+    db_session.commit()
+    event_id = str(uuid4())
+
+    # Act - The copy carries a different payload, so applying it would show
+    handle_employee_updated_batch(
+        [
+            {
+                "event_id": event_id,
+                "event_type": "employee.updated",
+                "data": {
+                    "employee_id": 1,
+                    "updated_fields": {"job_title": "Senior Engineer"},
+                },
+            },
+            {
+                "event_id": event_id,
+                "event_type": "employee.updated",
+                "data": {"employee_id": 1, "updated_fields": {"job_title": "Copy"}},
+            },
+        ]
+    )
+
+    # Assert
+    db_session.refresh(employee)
+    assert employee.job_title == "Senior Engineer"
+
+
+def test_events_retried_one_by_one_are_recorded(clean_employee_cache, db_session):
+    """Test that events applied after a failed batch are not applied again."""
+    # Arrange
+    for i in range(1, 4):
+        db_session.add(
+            EmployeeCache(
+                id=i,
+                email=f"employee{i}@company.com",
+                first_name="Employee",
+                last_name=f"{i}",
+                full_name=f"Employee {i}",
+                role="employee",
+                job_title="Engineer",
+                employment_type="permanent",
+                status="active",
+            )
+        )
+    db_session.commit()
+    first_event = {
+        "event_id": str(uuid4()),
+        "event_type": "employee.updated",
+        "data": {"employee_id": 1, "updated_fields": {"job_title": "Senior Engineer"}},
+    }
+
+    # Act - Employee 2's event fails the batch, so the events are retried singly
+    handle_employee_updated_batch(
+        [
+            first_event,
+            {
+                "event_id": str(uuid4()),
+                "event_type": "employee.updated",
+                "data": {
+                    "employee_id": 2,
+                    "updated_fields": {"email": "employee3@company.com"},
+                },
+            },
+        ]
+    )
+    employee = db_session.get(EmployeeCache, 1)
+    employee.job_title = "Changed since"
+    db_session.add(employee)
+    db_session.commit()
+    handle_employee_updated_batch([first_event])
+
+    # Assert - The redelivered event was recognised by its event_id
+    db_session.refresh(employee)
+    assert employee.job_title == "Changed since"
@@ -0,0 +1,211 @@
+"""
+Tests for the employee management service HTTP client.
+
+Requests are answered by an httpx.MockTransport, so no employee service is
+needed.
+"""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+import app.api.clients.employee_service as employee_service
+from app.api.clients.employee_service import EmployeeServiceClient, _endpoint_template
+
+
+class UnreadableStream(httpx.AsyncByteStream):
+    """Response body that fails the test if anything tries to read it."""
+
+    async def __aiter__(self):
+        raise AssertionError("response body should not be read")
+        yield b""
+
+
+def make_client(handler) -> EmployeeServiceClient:
+    """Build a client whose requests are answered by handler."""
+    return EmployeeServiceClient(
+        "http://employee-service", transport=httpx.MockTransport(handler)
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch):
+    """Retry 5xx responses without sleeping."""
+    monkeypatch.setattr(employee_service, "RETRY_BACKOFF_BASE", 0)
+
+
+@pytest.mark.asyncio
+async def test_server_error_is_retried():
+    """Test that a 5xx response is retried until the service answers."""
+    # Arrange
+    statuses = [503, 502]
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        if statuses:
+            return httpx.Response(statuses.pop(0))
+        return httpx.Response(200, json={"id": 1, "email": "john@company.com"})
+
+    client = make_client(handler)
+
+    # Act
+    employee_data = await client.get_employee(1)
+
+    # Assert
+    assert employee_data == {"id": 1, "email": "john@company.com"}
+    assert calls == ["/api/v1/employees/internal/1"] * 3
+
+
+@pytest.mark.asyncio
+async def test_server_error_gives_up_after_retries():
+    """Test that retries stop after REQUEST_RETRIES attempts."""
+    # Arrange
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(500)
+
+    client = make_client(handler)
+
+    # Act
+    employee_data = await client.get_employee(1)
+
+    # Assert
+    assert employee_data is None
+    assert len(calls) == employee_service.REQUEST_RETRIES
+
+
+@pytest.mark.asyncio
+async def test_not_found_body_is_not_read():
+    """Test that a non-200 lookup is answered from the status line alone."""
+    # Arrange
+    client = make_client(lambda request: httpx.Response(404, stream=UnreadableStream()))
+
+    # Act / Assert
+    assert await client.get_employee(1) is None
+    assert await client.verify_employee_exists(1) is False
+
+
+@pytest.mark.asyncio
+async def test_bulk_lookup_uses_bulk_endpoint():
+    """Test that several employees are fetched with one bulk request."""
+    # Arrange
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        ids = orjson.loads(request.content)["ids"]
+        return httpx.Response(200, json=[{"id": i} for i in ids if i != 3])
+
+    client = make_client(handler)
+
+    # Act
+    employees = await client.get_employees_by_ids([1, 2, 3, 1])
+
+    # Assert
+    assert employees == {1: {"id": 1}, 2: {"id": 2}, 3: None}
+    assert calls == [("POST", "/api/v1/employees/internal/bulk")]
+
+
+@pytest.mark.asyncio
+async def test_missing_bulk_endpoint_falls_back_to_single_lookups():
+    """Test the per-ID fallback, and that it is remembered for later calls."""
+    # Arrange
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        if request.url.path.endswith("/bulk"):
+            return httpx.Response(404)
+        employee_id = int(request.url.path.rsplit("/", 1)[1])
+        return httpx.Response(200, json={"id": employee_id})
+
+    client = make_client(handler)
+
+    # Act
+    first = await client.get_employees_by_ids([1, 2])
+    second = await client.get_employees_by_ids([3])
+
+    # Assert
+    assert first == {1: {"id": 1}, 2: {"id": 2}}
+    assert second == {3: {"id": 3}}
+    assert calls.count(("POST", "/api/v1/employees/internal/bulk")) == 1
+    assert sorted(path for method, path in calls if method == "GET") == [
+        "/api/v1/employees/internal/1",
+        "/api/v1/employees/internal/2",
+        "/api/v1/employees/internal/3",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_employees_prefetches_next_page():
+    """Test that the next page is requested while the caller holds the current one."""
+    # Arrange
+    offsets = []
+
+    def handler(request):
+        offset = int(request.url.params["offset"])
+        offsets.append(offset)
+        page = [{"id": i} for i in range(offset, min(offset + 2, 5))]
+        return httpx.Response(200, json=page)
+
+    client = make_client(handler)
+
+    # Act
+    pages = []
+    async for page in client.iter_employees(page_size=2):
+        await asyncio.sleep(0)
+        pages.append(([e["id"] for e in page], list(offsets)))
+
+    # Assert - Each page arrived with the following one already requested
+    assert pages == [([0, 1], [0, 2]), ([2, 3], [0, 2, 4]), ([4], [0, 2, 4])]
+
+
+@pytest.mark.asyncio
+async def test_iter_employees_cancels_prefetch_when_caller_stops():
+    """Test that leaving the iteration early cancels the prefetched request."""
+    # Arrange
+    cancelled = asyncio.Event()
+
+    async def handler(request):
+        if request.url.params["offset"] == "0":
+            return httpx.Response(200, json=[{"id": 1}, {"id": 2}])
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return httpx.Response(200, json=[])
+
+    client = make_client(handler)
+
+    # Act
+    employees = client.iter_employees(page_size=2)
+    first_page = await anext(employees)
+    await asyncio.sleep(0)
+    await employees.aclose()
+
+    # Assert
+    assert first_page == [{"id": 1}, {"id": 2}]
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+@pytest.mark.parametrize(
+    ("path", "template"),
+    [
+        ("/api/v1/employees/internal/42", "/api/v1/employees/internal/{employee_id}"),
+        (
+            "/api/v1/employees/internal/by-email/john%40company.com",
+            "/api/v1/employees/internal/by-email/{email}",
+        ),
+        ("/api/v1/employees/internal/list", "/api/v1/employees/internal/list"),
+        ("/api/v1/employees/internal/bulk", "/api/v1/employees/internal/bulk"),
+    ],
+)
+def test_endpoint_template_collapses_ids(path, template):
+    """Test that metric labels do not grow with employee IDs or emails."""
+    assert _endpoint_template(path) == template
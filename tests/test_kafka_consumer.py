@@ -0,0 +1,155 @@
+"""
+Tests for the Kafka consume loop's commit and replay behaviour.
+
+Runs the loop against a fake consumer, so no broker is needed.
+"""
+
+import orjson
+import pytest
+from sqlalchemy.exc import OperationalError
+
+import app.core.kafka as kafka
+from app.core.handlers.employee_handlers import handle_employee_updated_batch
+from app.core.kafka import KafkaConsumer
+
+
+class FakeMessage:
+    """Consumed message with the accessors the consume loop uses."""
+
+    def __init__(self, topic, partition, offset, value):
+        self._topic = topic
+        self._partition = partition
+        self._offset = offset
+        self._value = value if isinstance(value, bytes) else orjson.dumps(value)
+
+    def topic(self):
+        return self._topic
+
+    def partition(self):
+        return self._partition
+
+    def offset(self):
+        return self._offset
+
+    def value(self):
+        return self._value
+
+    def error(self):
+        return None
+
+
+class FakeConsumer:
+    """Serves prepared batches, then stops the loop; records commits and seeks."""
+
+    def __init__(self, *batches):
+        self.batches = list(batches)
+        self.commits = []
+        self.seeks = []
+
+    def subscribe(self, topics):
+        pass
+
+    def consume(self, num_messages, timeout):
+        if not self.batches:
+            KafkaConsumer._running = False
+            return []
+        return self.batches.pop(0)
+
+    def commit(self, offsets, asynchronous):
+        self.commits.append({(o.topic, o.partition): o.offset for o in offsets})
+
+    def seek(self, partition):
+        self.seeks.append((partition.topic, partition.partition, partition.offset))
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def run_consumer(monkeypatch):
+    """Run the consume loop over a fake consumer with the given batch handlers."""
+
+    def run(consumer, batch_handlers):
+        monkeypatch.setattr(KafkaConsumer, "_instance", consumer)
+        monkeypatch.setattr(KafkaConsumer, "_handlers", {})
+        monkeypatch.setattr(KafkaConsumer, "_batch_handlers", batch_handlers)
+        monkeypatch.setattr(KafkaConsumer, "_running", True)
+        monkeypatch.setattr(kafka, "CONSUMER_RETRY_BACKOFF", 0)
+        KafkaConsumer._consume_loop()
+
+    return run
+
+
+def test_malformed_employee_events_are_committed(run_consumer):
+    """Test that events the handler cannot parse do not stall the partition."""
+    # Arrange
+    consumer = FakeConsumer(
+        [
+            FakeMessage("employee-updated", 0, 5, {"data": None}),
+            FakeMessage("employee-updated", 0, 6, ["not", "an", "object"]),
+            FakeMessage("employee-updated", 0, 7, {"data": {"updated_fields": None}}),
+            FakeMessage("employee-updated", 0, 8, b"not json"),
+        ]
+    )
+
+    # Act
+    run_consumer(consumer, {"employee-updated": [handle_employee_updated_batch]})
+
+    # Assert
+    assert consumer.seeks == []
+    assert consumer.commits == [{("employee-updated", 0): 9}]
+
+
+def test_handler_bug_is_skipped_and_committed(run_consumer):
+    """Test that a non-transient handler error commits past the messages."""
+
+    # Arrange
+    def handler(messages):
+        raise ValueError("cannot handle these")
+
+    consumer = FakeConsumer([FakeMessage("topic-a", 0, 5, {"n": 1})])
+
+    # Act
+    run_consumer(consumer, {"topic-a": [handler]})
+
+    # Assert
+    assert consumer.seeks == []
+    assert consumer.commits == [{("topic-a", 0): 6}]
+
+
+def test_transient_database_error_replays_messages(run_consumer):
+    """Test that a database outage rewinds to the first unhandled message."""
+    # Arrange - topic-b fails once, then succeeds when consumed again
+    handled = []
+    failures = [OperationalError("SELECT 1", {}, Exception("server gone away"))]
+
+    def handle_a(messages):
+        handled.extend(messages)
+
+    def handle_b(messages):
+        if failures:
+            raise failures.pop()
+        handled.extend(messages)
+
+    consumer = FakeConsumer(
+        [
+            FakeMessage("topic-a", 0, 10, {"n": 1}),
+            FakeMessage("topic-b", 0, 7, {"n": 2}),
+            FakeMessage("topic-a", 0, 11, {"n": 3}),
+        ],
+        [
+            FakeMessage("topic-b", 0, 7, {"n": 2}),
+            FakeMessage("topic-a", 0, 11, {"n": 3}),
+        ],
+    )
+
+    # Act
+    run_consumer(consumer, {"topic-a": [handle_a], "topic-b": [handle_b]})
+
+    # Assert - Only the handled run was committed before the replay
+    assert consumer.seeks == [("topic-b", 0, 7), ("topic-a", 0, 11)]
+    assert consumer.commits == [
+        {("topic-a", 0): 11},
+        {("topic-b", 0): 8, ("topic-a", 0): 12},
+    ]
+    assert handled == [{"n": 1}, {"n": 2}, {"n": 3}]